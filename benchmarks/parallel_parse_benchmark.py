@@ -0,0 +1,58 @@
+""" This module benchmarks the parallel byte-range parsing of the CSVDataManager class against the number of cores.
+Run from the repository root: python -m benchmarks.parallel_parse_benchmark --rows 1000000 """
+import argparse
+import os
+import tempfile
+import time
+
+from src.csv_data_manager import CSVDataManager
+
+
+SAMPLE_FILE = 'resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv'
+
+
+def create_log(filepath: str, nr_of_rows: int) -> None:
+    """ Create a log with the headers of the sample file by repeating its rows. """
+    with open(SAMPLE_FILE, 'rb') as file:
+        header = file.readline()
+        rows = [row for row in file.read().splitlines(keepends=True) if row.strip()]
+
+    with open(filepath, 'wb') as file:
+        file.write(header)
+        for nr in range(0, nr_of_rows, len(rows)):
+            file.writelines(rows[:nr_of_rows - nr])
+
+
+def main() -> None:
+    ''' Parse the same log with an increasing number of worker processes and print the timings. '''
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=500_000, help='number of rows of the generated log')
+    parser.add_argument('--repeat', type=int, default=3, help='number of runs per worker count, the fastest one is reported')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1, help='largest number of worker processes')
+    args = parser.parse_args()
+
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= args.max_workers:
+        worker_counts.append(worker_counts[-1] * 2)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filepath = os.path.join(tmp_dir, 'TelemetryUI_log_benchmark.csv')
+        create_log(filepath, args.rows)
+        file_size = os.path.getsize(filepath) / 1e6
+        print(f"{args.rows} rows, {file_size:.1f} MB, {os.cpu_count()} cores")
+        print(f"{'workers':>8} {'seconds':>9} {'MB/s':>8} {'speedup':>8}")
+
+        baseline = None
+        for workers in worker_counts:
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                CSVDataManager(filepath, workers=workers)
+                timings.append(time.perf_counter() - start)
+            seconds = min(timings)
+            baseline = baseline or seconds
+            print(f"{workers:>8} {seconds:>9.3f} {file_size / seconds:>8.1f} {baseline / seconds:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,29 +1,667 @@
 """ This module contains the CSVDataManager class which is responsible for handling the operations related
 to reading and parsing CSV files. This includes loading data from a file, managing data frames, and providing
 access to the data for visualization purposes. """
-from typing import List, Optional, Dict, Union, Tuple
-import datetime
+from typing import Any, Callable, List, Optional, Dict, Union, Tuple, Hashable
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
 import colorsys
 import pathlib
+import os
+import io
+import hashlib
+import json
+import shutil
+import csv
+import functools
+import numpy as np
 import pandas as pd
 
 
+# Called with (bytes_read, total_bytes, rows_read) while a file is being loaded
+ProgressCallback = Callable[[int, int, int], None]
+
+DECIMATION_METHODS: Tuple[str, ...] = ('minmax', 'lttb', 'pyramid')
+
+
+HeadersMapping = Dict[Optional[str], List[List[Union[str, int]]]]
+
+
+def build_headers_mapping(headers: List[str], prefix: Optional[str] = 'Truma_n_') -> HeadersMapping:
+    """ Create a mapping of group headers to their header keys and indices, e.g.
+    'Truma_n_AmcuCommands::circFanSpeed' -> {'AmcuCommands': [['circFanSpeed', idx]]}. Headers without group map to None. """
+    hdr_mapping: HeadersMapping = {}
+
+    for idx, header in enumerate(headers):
+        strpped_header = header.replace(prefix, '') if prefix and prefix in header else header
+        group_header, header_key = strpped_header.split('::', 1) if '::' in strpped_header else (None, strpped_header)
+        hdr_mapping.setdefault(group_header, []).append([header_key, idx])
+
+    return hdr_mapping
+
+
+@functools.lru_cache(maxsize=32)
+def _scan_headers(filepath: str, size: int, mtime_ns: int, prefix: Optional[str]) -> Tuple[List[str], HeadersMapping]:
+    # A byte order mark is not part of the first header, the same as pandas does
+    with open(filepath, 'r', encoding='utf-8-sig', newline='') as file:
+        header_line = ''
+        # Leading blank lines are skipped, the same as pandas does
+        while not header_line.strip():
+            header_line = file.readline()
+            if not header_line:
+                raise pd.errors.EmptyDataError(f"No columns to parse from file: {filepath}")
+
+    headers: List[str] = []
+    seen_headers: Dict[str, int] = {}
+    for idx, header in enumerate(next(csv.reader([header_line.rstrip('\r\n')], delimiter=';', quotechar='|'))):
+        # Empty headers are named by their position like pandas does, e.g. for 'a;;b' or a trailing ';'
+        header = header or f"Unnamed: {idx}"
+        # Duplicated headers are renamed like pandas does: 'name', 'name.1', 'name.2', ...
+        unique_header = header
+        while unique_header in seen_headers:
+            seen_headers[header] += 1
+            unique_header = f"{header}.{seen_headers[header]}"
+        seen_headers.setdefault(unique_header, 0)
+        headers.append(unique_header)
+
+    return headers, build_headers_mapping(headers, prefix)
+
+
+def _file_stamp(filepath: str) -> np.ndarray:
+    """ Get the size and the modification time of a file, which a sidecar file stores to detect that it is outdated. """
+    stat = os.stat(filepath)
+    return np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+
+def _find_data_start(file: io.BufferedIOBase) -> int:
+    """ Skip the leading blank lines and the header line of a CSV file opened in binary mode at its start,
+    the same as pandas does, and get the byte offset of the first data row. """
+    file_size = os.fstat(file.fileno()).st_size
+    while file.readline().strip() == b'' and file.tell() < file_size:
+        pass
+    return file.tell()
+
+
+def scan_headers(filepath: str, prefix: Optional[str] = 'Truma_n_') -> Tuple[List[str], HeadersMapping]:
+    """ Read only the first line of a CSV file and get its headers and the headers mapping, without pandas parsing.
+    The result is cached per file version (path, size and modification time) and must not be modified. """
+    if not isinstance(filepath, (str, os.PathLike)):
+        raise ValueError(f"Invalid file path or buffer object type: {type(filepath)}")
+    stat = os.stat(filepath)
+    return _scan_headers(os.path.abspath(filepath), stat.st_size, stat.st_mtime_ns, prefix)
+
+
+class CSVSchema:
+    """ Immutable layout of a loaded file: the headers, a hashed header to index lookup, the headers mapping
+    and the column types. Built once per load, so validating and looking up headers takes constant time. """
+    __slots__ = ('_headers', '_indices', '_headers_mapping', '_dtypes')
+
+    def __init__(self, headers: List[str], prefix: Optional[str] = 'Truma_n_', dtypes: Optional[Dict[str, np.dtype]] = None,
+                 headers_mapping: Optional[HeadersMapping] = None):
+        object.__setattr__(self, '_headers', tuple(headers))
+        object.__setattr__(self, '_indices', {header: idx for idx, header in enumerate(self._headers)})
+        object.__setattr__(self, '_headers_mapping',
+                           headers_mapping if headers_mapping is not None else build_headers_mapping(self._headers, prefix))
+        object.__setattr__(self, '_dtypes', dict(dtypes or {}))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def __len__(self) -> int:
+        return len(self._headers)
+
+    def __contains__(self, header: str) -> bool:
+        return header in self._indices
+
+    @property
+    def headers(self) -> Tuple[str, ...]:
+        return self._headers
+
+    @property
+    def headers_mapping(self) -> HeadersMapping:
+        """ Get the mapping of group headers to header keys and indices, it must not be modified. """
+        return self._headers_mapping
+
+    @property
+    def dtypes(self) -> Dict[str, np.dtype]:
+        """ Get the column types, empty in lazy mode where the columns are not parsed at load. """
+        return dict(self._dtypes)
+
+    def index_of(self, header: str) -> int:
+        """ Get the index of a header, raises ValueError if it is unknown. """
+        try:
+            return self._indices[header]
+        except (KeyError, TypeError) as exc:
+            raise ValueError(f"Header '{header}' not found") from exc
+
+
+def _narrowest_int_dtype(min_val: float, max_val: float) -> np.dtype:
+    """ Get the narrowest integer type holding the range [min_val, max_val], unsigned if there are no negative values. """
+    for dtype in ((np.uint8, np.uint16, np.uint32, np.uint64) if min_val >= 0 else (np.int8, np.int16, np.int32, np.int64)):
+        info = np.iinfo(dtype)
+        if info.min <= min_val and max_val <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def _parse_byte_range(filepath: str, start: int, stop: int, headers: List[str], dtypes: List[str], shm_name: str,
+                      capacity: int, first_row: int) -> Optional[Tuple[int, List[int]]]:
+    """ Parse the rows in the byte range [start, stop) into the shared column buffers, runs in a worker process.
+    Returns the number of parsed rows and the indices of the integer columns written as float64 instead,
+    because the range contains missing or fractional values.
+    Returns None without writing if a column of the range is not numeric, e.g. a string after the sampled rows. """
+    with open(filepath, 'rb') as file:
+        file.seek(start)
+        range_bytes = file.read(stop - start)
+    try:
+        data = pd.read_csv(io.BytesIO(range_bytes), delimiter=';', quotechar='|', header=None, names=headers)
+    except pd.errors.EmptyDataError:
+        return 0, []
+    if not all(pd.api.types.is_numeric_dtype(data[header]) for header in headers):
+        return None
+
+    # The worker processes share the resource tracker of the parent, which unlinks the block
+    block = shared_memory.SharedMemory(name=shm_name)
+    promoted_idx_list = []
+    try:
+        for idx, header in enumerate(headers):
+            values = data[header].to_numpy()
+            dtype = np.dtype(dtypes[idx])
+            if dtype.kind == 'i' and values.dtype.kind == 'f':
+                promoted_idx_list.append(idx)
+                dtype = np.dtype(np.float64)
+            column = np.ndarray((capacity,), dtype=dtype, buffer=block.buf, offset=idx * capacity * 8)
+            column[first_row:first_row + len(values)] = values
+            del column
+    finally:
+        block.close()
+
+    return len(data), promoted_idx_list
+
+
+class _TruncatedFile(io.RawIOBase):
+    ''' Read-only binary file which ends at the given byte offset. '''
+    def __init__(self, file: io.BufferedIOBase, end_offset: int):
+        super().__init__()
+        self._file = file
+        self._end_offset = end_offset
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._file.read(max(0, min(len(buffer), self._end_offset - self._file.tell())))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+class LoadCancelledError(Exception):
+    ''' Raised by a progress callback to abort loading a file. '''
+
+
+def _decimate_min_max(time_data: np.ndarray, data: np.ndarray, nr_of_buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """ Keep the minimum and the maximum of every bucket in their original order, so no peak is lost. """
+    if len(data) <= 2 * nr_of_buckets:
+        return time_data, data
+
+    bucket_size = -(-len(data) // nr_of_buckets)
+    nr_of_buckets = -(-len(data) // bucket_size)
+    # Repeating the last value does not change the first occurrence of the extrema of the last bucket
+    buckets = np.pad(data, (0, nr_of_buckets * bucket_size - len(data)), mode='edge').reshape(nr_of_buckets, bucket_size)
+    positions = np.sort(np.stack([buckets.argmin(axis=1), buckets.argmax(axis=1)], axis=1), axis=1)
+    positions = (positions + np.arange(nr_of_buckets)[:, None] * bucket_size).ravel()
+    return time_data[positions], data[positions]
+
+
+def _decimate_lttb(time_data: np.ndarray, data: np.ndarray, nr_of_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """ Largest-Triangle-Three-Buckets: keep the point of every bucket spanning the largest triangle
+    with the previously kept point and the average of the next bucket. """
+    if len(data) <= nr_of_points or nr_of_points < 3:
+        return time_data, data
+
+    values = data.astype(np.float64, copy=False)
+    # The first and the last point are always kept, the points in between are split into buckets
+    edges = np.linspace(1, len(data) - 1, nr_of_points - 1).astype(np.int64)
+    bucket_sizes = np.diff(edges)
+    time_sums = np.concatenate(([0.0], np.cumsum(time_data)))
+    value_sums = np.concatenate(([0.0], np.cumsum(values)))
+    time_averages = np.append((time_sums[edges[1:]] - time_sums[edges[:-1]]) / bucket_sizes, time_data[-1])
+    value_averages = np.append((value_sums[edges[1:]] - value_sums[edges[:-1]]) / bucket_sizes, values[-1])
+
+    positions = np.empty(nr_of_points, dtype=np.int64)
+    positions[0], positions[-1] = 0, len(data) - 1
+    selected = 0
+    for bucket in range(nr_of_points - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        area = np.abs((time_data[selected] - time_averages[bucket + 1]) * (values[start:stop] - values[selected])
+                      - (time_data[selected] - time_data[start:stop]) * (value_averages[bucket + 1] - values[selected]))
+        selected = start + int(area.argmax())
+        positions[bucket + 1] = selected
+
+    return time_data[positions], data[positions]
+
+
+class MinMaxPyramid:
+    ''' Minima and maxima of a signal for buckets of 2, 4, 8, ... rows, one level per power of two.
+    Level k holds the extrema of the rows [j * 2**k, (j + 1) * 2**k) at position j, level 0 is the signal itself.
+    The last position of a level covers the remaining rows, so every level covers all rows. '''
+    def __init__(self, minima: List[np.ndarray], maxima: List[np.ndarray]):
+        self.minima: List[np.ndarray] = minima
+        self.maxima: List[np.ndarray] = maxima
+
+    @classmethod
+    def from_array(cls, data: np.ndarray) -> 'MinMaxPyramid':
+        """ Build every level by pairwise reducing the level below, NaN values are ignored.
+        An unpaired last element is carried into the next level, which has ceil(n / 2**k) elements. """
+        minima, maxima = [data], [data]
+        while len(minima[-1]) > 1:
+            length = len(minima[-1]) // 2 * 2
+            minima.append(np.fmin(minima[-1][0:length:2], minima[-1][1:length:2]))
+            maxima.append(np.fmax(maxima[-1][0:length:2], maxima[-1][1:length:2]))
+            if len(minima[-2]) > length:
+                minima[-1] = np.append(minima[-1], minima[-2][-1:])
+                maxima[-1] = np.append(maxima[-1], maxima[-2][-1:])
+
+        return cls(minima, maxima)
+
+    @property
+    def nbytes(self) -> int:
+        """ Get the memory used by the levels above the signal itself. """
+        return sum(level.nbytes for level in self.minima[1:] + self.maxima[1:])
+
+    def decimate(self, start: int, stop: int, nr_of_buckets: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """ Get the first rows, minima and maxima of the buckets of the finest level
+        which covers the rows [start, stop) with at most about nr_of_buckets buckets. """
+        level = min(max(0, int(np.ceil(np.log2(max(1.0, (stop - start) / max(1, nr_of_buckets)))))), len(self.minima) - 1)
+        bucket_start = start >> level
+        bucket_stop = min(-(-stop >> level), len(self.minima[level]))
+        rows = np.arange(bucket_start, bucket_stop) << level
+        return rows, self.minima[level][bucket_start:bucket_stop], self.maxima[level][bucket_start:bucket_stop]
+
+    def range_extrema(self, start: int, stop: int) -> Tuple[float, float]:
+        """ Get the minimum and maximum of the rows [start, stop) from at most two buckets per level,
+        like a segment tree query in O(log n). """
+        minimum, maximum = np.nan, np.nan
+        level = 0
+        while start < stop:
+            if start & 1:
+                minimum, maximum = np.fmin(minimum, self.minima[level][start]), np.fmax(maximum, self.maxima[level][start])
+                start += 1
+            if stop & 1:
+                stop -= 1
+                minimum, maximum = np.fmin(minimum, self.minima[level][stop]), np.fmax(maximum, self.maxima[level][stop])
+            start, stop, level = start >> 1, stop >> 1, level + 1
+
+        return float(minimum), float(maximum)
+
+
+class RunLengthColumn:
+    ''' Column stored as runs of equal values, run j holds values[j] from the row starts[j] up to the next start.
+    Suits constant signals and signals which change only a few times, e.g. flags and modes. '''
+    def __init__(self, starts: np.ndarray, values: np.ndarray, nr_of_rows: int):
+        self.starts: np.ndarray = starts
+        self.values: np.ndarray = values
+        self.nr_of_rows: int = nr_of_rows
+
+    @staticmethod
+    def count_runs(data: np.ndarray) -> int:
+        """ Count the runs of equal values without encoding them. """
+        return int(np.count_nonzero(data[1:] != data[:-1])) + 1 if len(data) else 0
+
+    @classmethod
+    def from_array(cls, data: np.ndarray) -> 'RunLengthColumn':
+        starts = np.concatenate(([0], np.flatnonzero(data[1:] != data[:-1]) + 1)) if len(data) else np.empty(0, dtype=np.int64)
+        return cls(starts.astype(np.int64), data[starts], len(data))
+
+    @property
+    def nbytes(self) -> int:
+        return self.starts.nbytes + self.values.nbytes
+
+    def to_array(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """ Expand the rows [start, stop) to a dense array. """
+        stop = self.nr_of_rows if stop is None else min(stop, self.nr_of_rows)
+        if start >= stop:
+            return self.values[:0].copy()
+        first, last = self._run_range(start, stop)
+        run_stops = np.append(self.starts[first + 1:last], stop)
+        run_starts = np.maximum(self.starts[first:last], start)
+        return np.repeat(self.values[first:last], run_stops - run_starts)
+
+    def range_extrema(self, start: int, stop: int) -> Tuple[float, float]:
+        """ Get the minimum and maximum of the rows [start, stop) from the values of the overlapping runs. """
+        first, last = self._run_range(start, min(stop, self.nr_of_rows))
+        values = self.values[first:last]
+        return float(np.fmin.reduce(values)), float(np.fmax.reduce(values))
+
+    def _run_range(self, start: int, stop: int) -> Tuple[int, int]:
+        """ Get the range [first, last) of the runs overlapping the rows [start, stop). """
+        return int(np.searchsorted(self.starts, start, side='right')) - 1, int(np.searchsorted(self.starts, stop, side='left'))
+
+
+class RowOffsetIndex:
+    ''' Byte offset and absolute timestamp (seconds since the epoch) of every n-th data row of a CSV file,
+    to parse only the part of a file which covers a time window. '''
+    _SCAN_BLOCK_BYTES: int = 1 << 24
+
+    def __init__(self, every: int, offsets: np.ndarray, timestamps: np.ndarray, stamp: np.ndarray):
+        self.every: int = every
+        self.offsets: np.ndarray = offsets
+        self.timestamps: np.ndarray = timestamps
+        # Size and modification time of the indexed file
+        self.stamp: np.ndarray = stamp
+
+    @classmethod
+    def build(cls, filepath: str, every: int = 1000) -> 'RowOffsetIndex':
+        """ Scan the line endings of the file block by block, only the first field of every n-th row is parsed. """
+        if not isinstance(every, int) or every < 1:
+            raise ValueError(f"Row interval '{every}' must be a positive integer.")
+
+        with open(filepath, 'rb') as file:
+            # The row 0 starts behind the header line, every following line ending starts the next row
+            block_start = _find_data_start(file)
+            offsets = [np.array([block_start], dtype=np.int64)]
+            nr_of_rows = 1
+            while block := file.read(cls._SCAN_BLOCK_BYTES):
+                line_starts = np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == ord('\n')) + block_start + 1
+                rows = np.arange(nr_of_rows, nr_of_rows + len(line_starts))
+                offsets.append(line_starts[rows % every == 0])
+                nr_of_rows += len(line_starts)
+                block_start += len(block)
+
+            offsets = np.concatenate(offsets) if offsets else np.empty(0, dtype=np.int64)
+            # A row needs at least its first field, e.g. not the empty line after the last row
+            first_fields = []
+            for offset in offsets:
+                file.seek(offset)
+                first_fields.append(file.readline().split(b';', 1)[0].strip())
+        offsets = np.array([offset for offset, field in zip(offsets, first_fields) if field], dtype=np.int64)
+        first_fields = [field.decode() for field in first_fields if field]
+
+        try:
+            timestamps = np.array([float(field) for field in first_fields], dtype=np.float64)
+        except ValueError:
+            timestamps = np.array([pd.Timestamp(field).timestamp() for field in first_fields], dtype=np.float64)
+
+        return cls(every, offsets, timestamps, _file_stamp(filepath))
+
+    def save(self, filepath: str) -> None:
+        with open(filepath, 'wb') as file:
+            np.savez(file, every=self.every, offsets=self.offsets, timestamps=self.timestamps, stamp=self.stamp)
+
+    @classmethod
+    def load(cls, filepath: str, csv_filepath: str) -> Optional['RowOffsetIndex']:
+        """ Load an index, None if there is none or if it belongs to an older version of the CSV file. """
+        try:
+            with np.load(filepath) as index:
+                if not np.array_equal(index['stamp'], _file_stamp(csv_filepath)):
+                    return None
+                return cls(int(index['every']), index['offsets'], index['timestamps'], index['stamp'])
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def byte_range(self, t_start: Optional[float] = None, t_end: Optional[float] = None) -> Tuple[int, Optional[int]]:
+        """ Get the byte range [start, stop) covering the rows of the time window in seconds relative to the first row.
+        stop is None if the range reaches the end of the file. """
+        relative_timestamps = self.timestamps - self.timestamps[0]
+        first = 0 if t_start is None else max(0, int(np.searchsorted(relative_timestamps, t_start, side='right')) - 1)
+        last = len(self.offsets) if t_end is None else int(np.searchsorted(relative_timestamps, t_end, side='right'))
+        return int(self.offsets[first]), int(self.offsets[last]) if last < len(self.offsets) else None
+
+
+class ColumnProfile:
+    ''' Summary statistics of every column of a CSV file, one array entry per column index. '''
+    # Upper bound of the temporary float64 block used while profiling
+    _BLOCK_BYTES: int = 1 << 26
+    # Number of rows sampled to estimate the number of unique values
+    _NUNIQUE_SAMPLE_ROWS: int = 1024
+
+    def __init__(self, nr_of_columns: int):
+        self.nr_of_rows: int = 0
+        self.minimum: np.ndarray = np.full(nr_of_columns, np.nan)
+        self.maximum: np.ndarray = np.full(nr_of_columns, np.nan)
+        self.first: np.ndarray = np.full(nr_of_columns, np.nan)
+        self.is_constant: np.ndarray = np.zeros(nr_of_columns, dtype=bool)
+        self.is_zero: np.ndarray = np.zeros(nr_of_columns, dtype=bool)
+        self.nan_count: np.ndarray = np.zeros(nr_of_columns, dtype=np.int64)
+        self.nunique_estimate: np.ndarray = np.zeros(nr_of_columns, dtype=np.int64)
+
+    @classmethod
+    def from_dataframe(cls, dataframe: pd.DataFrame, headers: List[str]) -> 'ColumnProfile':
+        """ Profile all columns in one vectorized pass over blocks of numeric columns. """
+        profile = cls(len(headers))
+        nr_of_rows = profile.nr_of_rows = len(dataframe)
+        numeric_idx_list = []
+        for idx, header in enumerate(headers):
+            if pd.api.types.is_numeric_dtype(dataframe[header]):
+                numeric_idx_list.append(idx)
+            else:
+                profile._profile_non_numeric(idx, dataframe[header])
+
+        block_width = max(1, cls._BLOCK_BYTES // max(1, nr_of_rows * 8))
+        for start in range(0, len(numeric_idx_list), block_width):
+            idx_block = numeric_idx_list[start:start + block_width]
+            block = np.empty((nr_of_rows, len(idx_block)))
+            for column, idx in enumerate(idx_block):
+                block[:, column] = dataframe[headers[idx]].to_numpy(dtype=np.float64)
+            profile._profile_block(idx_block, block)
+
+        return profile
+
+    def extend(self, dataframe: pd.DataFrame, headers: List[str]) -> None:
+        """ Update the profile with appended rows by merging it with the profile of only those rows. """
+        if not len(dataframe):
+            return
+        appended = ColumnProfile.from_dataframe(dataframe, headers)
+        if not self.nr_of_rows:
+            self.__dict__.update(appended.__dict__)
+            return
+
+        self.nr_of_rows += appended.nr_of_rows
+        self.is_constant &= appended.is_constant & (appended.first == self.first)
+        self.is_zero &= appended.is_zero
+        self.nan_count += appended.nan_count
+        self.minimum = np.fmin(self.minimum, appended.minimum)
+        self.maximum = np.fmax(self.maximum, appended.maximum)
+        self.nunique_estimate = np.maximum(self.nunique_estimate, appended.nunique_estimate)
+
+    def _profile_block(self, idx_block: List[int], block: np.ndarray) -> None:
+        """ Profile a 2D block with one column per index of idx_block. """
+        self.is_zero[idx_block] = (block == 0).all(axis=0)
+        self.nan_count[idx_block] = np.isnan(block).sum(axis=0)
+        if not len(block):
+            # Like .all() on an empty column, no value differs from the first one
+            self.is_constant[idx_block] = True
+            return
+
+        self.first[idx_block] = block[0]
+        # NaN never compares equal, so a column containing NaN is not constant
+        self.is_constant[idx_block] = (block == block[0]).all(axis=0)
+        # fmin/fmax ignore NaN unless the whole column is NaN
+        self.minimum[idx_block] = np.fmin.reduce(block, axis=0)
+        self.maximum[idx_block] = np.fmax.reduce(block, axis=0)
+
+        sample = np.sort(block[::max(1, len(block) // self._NUNIQUE_SAMPLE_ROWS)], axis=0)
+        valid = ~np.isnan(sample)
+        changes = (np.diff(sample, axis=0) != 0) & valid[1:]
+        self.nunique_estimate[idx_block] = valid[0] + changes.sum(axis=0)
+
+    def _profile_non_numeric(self, idx: int, column: pd.Series) -> None:
+        """ Profile a column which can not be converted to float, e.g. date-time strings. """
+        self.is_constant[idx] = bool((column == column.iloc[0]).all()) if len(column) else True
+        self.is_zero[idx] = bool((column == 0).all())
+        self.nan_count[idx] = int(column.isna().sum())
+        self.nunique_estimate[idx] = int(column.nunique())
+
+
+class MemoryCache:
+    """ Least recently used cache of converted columns and derived products, e.g. decimations and pyramids,
+    within a memory budget in bytes. Counts the hits and misses of the lookups. """
+    def __init__(self, max_bytes: int):
+        self.max_bytes: int = max_bytes
+        self.nbytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, int]]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Any:
+        """ Get an entry and mark it as most recently used, None if it is not cached. """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: int) -> Any:
+        """ Store an entry and evict the least recently used ones beyond the budget.
+        An entry larger than the whole budget is not stored. Returns the value. """
+        if key in self._entries:
+            self.nbytes -= self._entries.pop(key)[1]
+        if nbytes <= self.max_bytes:
+            self._entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes:
+                self.nbytes -= self._entries.popitem(last=False)[1][1]
+        return value
+
+    def items(self, kind: str) -> List[Tuple[Hashable, Any]]:
+        """ Get the entries whose key is a tuple starting with kind, without changing their order. """
+        return [(key, value) for key, (value, _) in self._entries.items() if isinstance(key, tuple) and key[0] == kind]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.nbytes = 0
+
+
 class CSVDataManager:
     ''' Module for CSV file operations '''
-    def __init__(self, filepath: str, prefix: Optional[str] = 'Truma_n_'):
+    # Number of bytes sampled from the start of the file to estimate the row count
+    _ROW_ESTIMATE_SAMPLE_BYTES: int = 1 << 16
+    # Block size of the backward scan for the last line ending of a followed file
+    _END_SCAN_BLOCK_BYTES: int = 1 << 16
+    # Growth factor of the column buffers if the row estimate was too small
+    _BUFFER_GROWTH_FACTOR: float = 1.5
+    # Number of bytes hashed at the start and at the end of the file for the cache key
+    _CACHE_HASH_SAMPLE_BYTES: int = 1 << 20
+    _CACHE_META_FILE: str = 'meta.json'
+    # Block size of the forward scans counting the line endings of a byte range
+    _LINE_COUNT_BLOCK_BYTES: int = 1 << 24
+    # Memory used per element by a list of Python floats: the pointer and the float object
+    _FLOAT_LIST_ITEM_BYTES: int = 32
+    _PYRAMID_FILE_SUFFIX: str = '.pyramids.npz'
+    _ROW_INDEX_FILE_SUFFIX: str = '.rows.npz'
+    # Column types chosen by the dtype optimization of previously loaded files, per header layout
+    _dtype_schemas: Dict[Tuple[str, ...], Dict[str, np.dtype]] = {}
+
+    def __init__(self, filepath: str, prefix: Optional[str] = 'Truma_n_', chunksize: Optional[int] = None,
+                 progress_callback: Optional[ProgressCallback] = None, cache_dir: Optional[str] = None,
+                 cache_max_bytes: int = 1 << 30, lazy: bool = False, follow: bool = False, workers: Optional[int] = None,
+                 optimize_dtypes: bool = False, run_length_ratio: Optional[float] = None,
+                 memory_cache_max_bytes: int = 1 << 28):
         self._filepath: str = filepath
         self._prefix: str = prefix
+        self._chunksize: Optional[int] = chunksize
+        self._progress_callback: Optional[ProgressCallback] = progress_callback
+        self._cache_dir: Optional[str] = cache_dir
+        self._cache_max_bytes: int = cache_max_bytes
+        self._lazy: bool = lazy
+        self._follow: bool = follow
+        self._workers: Optional[int] = workers
+        self._optimize_dtypes: bool = optimize_dtypes
+        self._run_length_ratio: Optional[float] = run_length_ratio
+        # Columns moved out of the DataFrame into run-length encoded storage
+        self._rle_columns: Dict[str, RunLengthColumn] = {}
+        # Parallel parsing only: the shared memory block holding the columns
+        self._shared_memory: Optional[shared_memory.SharedMemory] = None
+        self._time_data: Optional[np.ndarray] = None
+        # Milliseconds since the epoch of the first row, the origin of the relative time data
+        self._time_origin_ms: Optional[int] = None
+        self._profile: Optional[ColumnProfile] = None
+        # Converted columns, decimations, extrema and min/max pyramids, evicted least recently used first
+        self._memory_cache: MemoryCache = MemoryCache(memory_cache_max_bytes)
+        self._row_index: Optional[RowOffsetIndex] = None
+        self._schema: Optional[CSVSchema] = None
+        # Follow mode only: growable column buffers and the end of the last complete line
+        self._buffers: Dict[str, np.ndarray] = {}
+        self._time_buffer: Optional[np.ndarray] = None
+        self._end_offset: int = 0
+
+        if lazy and follow:
+            raise ValueError("The follow mode can not be combined with the lazy mode.")
+        if run_length_ratio is not None and (lazy or follow):
+            raise ValueError("The run-length encoded storage can not be combined with the lazy or the follow mode.")
 
         self.loaded = self._load_data()
 
-        self._nr_of_data: int = len(self._dataframe.columns)
+        self._nr_of_data: int = len(self._headers)
+
+        if follow:
+            self._init_follow()
 
     def _load_data(self) -> Optional[pd.DataFrame]:
         """  Load and return data from a CSV file. """
         self._dataframe: pd.DataFrame = None
+        self._headers: List[str] = []
         try:
-            self._dataframe = pd.read_csv(self._filepath, delimiter=';', quotechar='|')
+            if self._follow:
+                self._end_offset = self._find_end_offset()
+            # The cache holds finished files, a followed file is still being written
+            if self._cache_dir is not None and not self._follow:
+                self._dataframe = self._read_cache()
+            if self._dataframe is None and self._lazy:
+                # Only the header line is parsed, the columns are loaded on demand
+                headers, headers_mapping = scan_headers(self._filepath, self._prefix)
+                self._schema = CSVSchema(headers, self._prefix, headers_mapping=headers_mapping)
+                self._headers = self._schema.headers
+                self._dataframe = pd.DataFrame()
+                return True
+            if self._dataframe is None:
+                if self._workers is not None and self._workers > 1:
+                    self._dataframe = self._read_csv_parallel()
+                if self._dataframe is None:
+                    if self._chunksize is not None:
+                        self._dataframe = self._read_csv_chunked()
+                    elif self._follow:
+                        with self._open_csv_file() as file:
+                            self._dataframe = pd.read_csv(file, delimiter=';', quotechar='|')
+                    else:
+                        self._dataframe = pd.read_csv(self._filepath, delimiter=';', quotechar='|')
+                self._headers = self._dataframe.columns.tolist()
+                # The cache holds the parsed types, so loads with and without the dtype optimization can share it
+                if self._cache_dir is not None and not self._follow:
+                    self._write_cache()
+            if self._optimize_dtypes:
+                self._headers = self._dataframe.columns.tolist()
+                self._downcast_columns()
+            self._schema = CSVSchema(self._dataframe.columns.tolist(), self._prefix, dtypes=self._dataframe.dtypes.to_dict())
+            # The header list used while loading is replaced by the immutable one of the schema
+            self._headers = self._schema.headers
+            if self._run_length_ratio is not None:
+                self.compact_columns(self._run_length_ratio)
             return True
+        except LoadCancelledError:
+            raise
         except FileNotFoundError as exc:
             raise FileNotFoundError(f"The file {self._filepath} was not found.") from exc
         except pd.errors.EmptyDataError as exc:
@@ -37,12 +675,400 @@ class CSVDataManager:
         except Exception as exc:
             raise Exception(f"An unexpected error occurred: {exc}") from exc
 
+    def _report_progress(self, bytes_read: int, total_bytes: int, rows_read: int) -> None:
+        if self._progress_callback is not None:
+            self._progress_callback(bytes_read, total_bytes, rows_read)
+
+    def _estimate_row_count(self, total_bytes: int) -> int:
+        """ Estimate the number of rows from the average line length at the start of the file. """
+        with open(self._filepath, 'rb') as file:
+            sample = file.read(self._ROW_ESTIMATE_SAMPLE_BYTES)
+        nr_of_lines = sample.count(b'\n')
+        if nr_of_lines < 2 or len(sample) >= total_bytes:
+            return max(nr_of_lines, 1)
+        # The first line holds the headers and is usually longer than a data row
+        bytes_per_row = (len(sample) - sample.index(b'\n')) / (nr_of_lines - 1)
+        return int(total_bytes / bytes_per_row * 1.05) + 1
+
+    @classmethod
+    def _write_to_buffers(cls, buffers: Dict[str, np.ndarray], nr_of_rows: int, chunk: pd.DataFrame) -> None:
+        """ Write the rows of a chunk behind the first nr_of_rows rows of the column buffers, growing them if needed. """
+        capacity = len(next(iter(buffers.values())))
+        if capacity < nr_of_rows + len(chunk):
+            capacity = max(int(capacity * cls._BUFFER_GROWTH_FACTOR), nr_of_rows + len(chunk))
+            for column, buffer in buffers.items():
+                grown_buffer = np.empty(capacity, dtype=buffer.dtype)
+                grown_buffer[:nr_of_rows] = buffer[:nr_of_rows]
+                buffers[column] = grown_buffer
+
+        for column in chunk.columns:
+            values = chunk[column].to_numpy()
+            buffer = buffers[column]
+            # Promote the column if the chunk does not fit the current type, e.g. int -> float or uint8 -> int16
+            if values.dtype != buffer.dtype:
+                if buffer.dtype.kind in 'iu' and values.dtype.kind in 'iu' and len(values):
+                    dtype = np.result_type(buffer.dtype, _narrowest_int_dtype(values.min(), values.max()))
+                else:
+                    dtype = np.result_type(buffer.dtype, values.dtype)
+                if dtype != buffer.dtype:
+                    buffer = buffers[column] = buffer.astype(dtype)
+            buffer[nr_of_rows:nr_of_rows + len(chunk)] = values
+
+    def _read_csv_chunked(self) -> pd.DataFrame:
+        """ Parse the CSV file chunk by chunk directly into preallocated column buffers.
+        Unlike concatenating the chunks, the final columns are built without an intermediate copy
+        and the progress is reported after every chunk. """
+        total_bytes = self._end_offset if self._follow else os.path.getsize(self._filepath)
+        buffers: Dict[str, np.ndarray] = {}
+        nr_of_rows = 0
+
+        with self._open_csv_file() as file:
+            reader = pd.read_csv(file, delimiter=';', quotechar='|', chunksize=self._chunksize)
+            for chunk in reader:
+                if not buffers:
+                    capacity = max(self._estimate_row_count(total_bytes), len(chunk))
+                    buffers = {column: np.empty(capacity, dtype=chunk[column].to_numpy().dtype) for column in chunk.columns}
+                    if self._optimize_dtypes:
+                        # Start with the narrow integer types of a previous file, they are promoted if a value does not fit
+                        schema = self._dtype_schemas.get(tuple(chunk.columns), {})
+                        for column, dtype in schema.items():
+                            if dtype.kind in 'iu' and buffers[column].dtype.kind in 'iu':
+                                buffers[column] = np.empty(capacity, dtype=dtype)
+
+                self._write_to_buffers(buffers, nr_of_rows, chunk)
+                nr_of_rows += len(chunk)
+                self._report_progress(file.tell(), total_bytes, nr_of_rows)
+
+        if not buffers:
+            # Only the header line is present
+            with self._open_csv_file() as file:
+                return pd.read_csv(file, delimiter=';', quotechar='|')
+
+        self._report_progress(total_bytes, total_bytes, nr_of_rows)
+        columns = {}
+        for column in list(buffers):
+            buffer = buffers.pop(column)
+            # Release the overestimated capacity column by column to keep the peak memory low
+            columns[column] = buffer[:nr_of_rows] if len(buffer) - nr_of_rows <= nr_of_rows // 10 else buffer[:nr_of_rows].copy()
+        return pd.DataFrame(columns, copy=False)
+
+    def _open_csv_file(self) -> io.BufferedIOBase:
+        """ Open the CSV file for parsing, in follow mode only up to the end of the last complete line. """
+        file = open(self._filepath, 'rb')
+        return io.BufferedReader(_TruncatedFile(file, self._end_offset)) if self._follow else file
+
+    def _find_end_offset(self) -> int:
+        """ Find the end of the last complete line, a line still being written is read once it is complete. """
+        with open(self._filepath, 'rb') as file:
+            position = file.seek(0, os.SEEK_END)
+            while position > 0:
+                block_start = max(0, position - self._END_SCAN_BLOCK_BYTES)
+                file.seek(block_start)
+                block = file.read(position - block_start)
+                if b'\n' in block:
+                    return block_start + block.rindex(b'\n') + 1
+                position = block_start
+        return 0
+
+    def _init_follow(self) -> None:
+        """ Move the columns into growable buffers. """
+        nr_of_rows = len(self._dataframe)
+        if not nr_of_rows:
+            # Only the header line is present, its columns have no type yet, the buffers are created on refresh
+            return
+        capacity = int(nr_of_rows * self._BUFFER_GROWTH_FACTOR) + 1
+        for header in self._headers:
+            buffer = np.empty(capacity, dtype=self._dataframe[header].to_numpy().dtype)
+            buffer[:nr_of_rows] = self._dataframe[header].to_numpy()[:nr_of_rows]
+            self._buffers[header] = buffer
+        self._set_dataframe_from_buffers(nr_of_rows)
+
+    def _set_dataframe_from_buffers(self, nr_of_rows: int) -> None:
+        self._dataframe = pd.DataFrame({header: buffer[:nr_of_rows] for header, buffer in self._buffers.items()}, copy=False)
+
+    def refresh(self) -> int:
+        """ Parse the rows appended to the file since it was loaded or last refreshed (follow mode only).
+        The columns, the time data and the column profile are extended incrementally,
+        so the cost depends on the number of appended rows rather than on the file size.
+        Returns the number of appended rows. """
+        if not self._follow:
+            raise ValueError("Refreshing requires the follow mode (follow=True).")
+
+        with open(self._filepath, 'rb') as file:
+            file_size = file.seek(0, os.SEEK_END)
+            if file_size < self._end_offset:
+                raise ValueError(f"The file {self._filepath} was truncated.")
+            file.seek(self._end_offset)
+            appended_bytes = file.read(file_size - self._end_offset)
+        if b'\n' not in appended_bytes:
+            return 0
+        appended_bytes = appended_bytes[:appended_bytes.rindex(b'\n') + 1]
+
+        try:
+            appended_rows = pd.read_csv(io.BytesIO(appended_bytes), delimiter=';', quotechar='|', header=None, names=self._headers)
+        except pd.errors.EmptyDataError:
+            appended_rows = pd.DataFrame()
+        self._end_offset += len(appended_bytes)
+        if appended_rows.empty:
+            return 0
+
+        nr_of_rows = len(self._dataframe)
+        if not self._buffers:
+            # The first rows of a file which had only its header line define the column types
+            capacity = int(len(appended_rows) * self._BUFFER_GROWTH_FACTOR) + 1
+            self._buffers = {header: np.empty(capacity, dtype=appended_rows[header].to_numpy().dtype) for header in self._headers}
+            self._schema = CSVSchema(self._headers, self._prefix, dtypes=appended_rows.dtypes.to_dict(),
+                                     headers_mapping=self._schema.headers_mapping)
+        self._write_to_buffers(self._buffers, nr_of_rows, appended_rows)
+        self._set_dataframe_from_buffers(nr_of_rows + len(appended_rows))
+
+        if self._time_data is not None:
+            milliseconds = self._time_in_milliseconds(appended_rows['time index'])
+            if self._time_origin_ms is None:
+                # The file had no rows when the time data was first read
+                self._time_origin_ms = int(milliseconds[0])
+            self._extend_time_data((milliseconds - self._time_origin_ms) / 1e3)
+        if self._profile is not None:
+            self._profile.extend(appended_rows, self._headers)
+        self._memory_cache.clear()
+
+        return len(appended_rows)
+
+    def _extend_time_data(self, time_data: np.ndarray) -> None:
+        nr_of_rows = len(self._time_data)
+        if self._time_buffer is None or len(self._time_buffer) < nr_of_rows + len(time_data):
+            self._time_buffer = np.empty(int((nr_of_rows + len(time_data)) * self._BUFFER_GROWTH_FACTOR))
+            self._time_buffer[:nr_of_rows] = self._time_data
+        self._time_buffer[nr_of_rows:nr_of_rows + len(time_data)] = time_data
+        self._time_data = self._time_buffer[:nr_of_rows + len(time_data)].view()
+        self._time_data.flags.writeable = False
+
+    def _downcast_columns(self) -> None:
+        """ Store every numeric column in the narrowest type which holds all of its values exactly,
+        e.g. flags as uint8. The schema of a previous file with the same headers tells which float columns
+        failed to fit into float32, so they are not checked again. """
+        headers = tuple(self._headers)
+        schema = self._dtype_schemas.get(headers, {})
+        profile = self.column_profile
+        columns = {}
+        for idx, header in enumerate(self._headers):
+            data = self._dataframe[header].to_numpy()
+            dtype = data.dtype
+            if dtype.kind in 'iu' and profile.nr_of_rows:
+                dtype = _narrowest_int_dtype(profile.minimum[idx], profile.maximum[idx])
+            elif dtype == np.float64 and schema.get(header, np.dtype(np.float32)) == np.float32:
+                if np.array_equal(data.astype(np.float32).astype(np.float64), data, equal_nan=True):
+                    dtype = np.dtype(np.float32)
+            # Columns in the shared memory block of the parallel parsing are copied so the block can be released
+            columns[header] = data.astype(dtype) if dtype != data.dtype or self._shared_memory is not None else data
+
+        self._dataframe = pd.DataFrame(columns, copy=False)
+        self._dtype_schemas[headers] = {header: column.dtype for header, column in columns.items()}
+        if self._shared_memory is not None:
+            del columns, data
+            try:
+                self._shared_memory.close()
+                self._shared_memory = None
+            except BufferError:
+                # Still referenced, the block is released together with the manager
+                pass
+
+    def _split_byte_ranges(self, data_start: int, data_stop: int, nr_of_ranges: int) -> List[Tuple[int, int]]:
+        """ Split the data rows into byte ranges of about the same size at line endings. """
+        boundaries = [data_start]
+        with open(self._filepath, 'rb') as file:
+            for nr in range(1, nr_of_ranges):
+                file.seek(data_start + (data_stop - data_start) * nr // nr_of_ranges)
+                file.readline()
+                boundaries.append(min(max(file.tell(), boundaries[-1]), data_stop))
+        boundaries.append(data_stop)
+        return [(start, stop) for start, stop in zip(boundaries[:-1], boundaries[1:]) if start < stop]
+
+    def _count_lines(self, start: int, stop: int) -> int:
+        """ Count the lines in the byte range [start, stop), an upper bound of the number of rows. """
+        nr_of_lines = 0
+        with open(self._filepath, 'rb') as file:
+            file.seek(start)
+            last_byte = b''
+            while start < stop:
+                block = file.read(min(self._LINE_COUNT_BLOCK_BYTES, stop - start))
+                if not block:
+                    break
+                nr_of_lines += block.count(b'\n')
+                start += len(block)
+                last_byte = block[-1:]
+        # The last line of the file may have no line ending
+        return nr_of_lines + (last_byte not in (b'\n', b''))
+
+    def _read_csv_parallel(self) -> Optional[pd.DataFrame]:
+        """ Parse byte ranges of the file in worker processes directly into one shared memory block of columns.
+        Returns None if the columns can not be stored in the shared 8 byte column buffers, e.g. strings,
+        also if only a range after the sampled rows contains them. """
+        headers = list(scan_headers(self._filepath, self._prefix)[0])
+        with open(self._filepath, 'rb') as file:
+            data_start = _find_data_start(file)
+        data_stop = self._end_offset if self._follow else os.path.getsize(self._filepath)
+
+        # The column types are taken from the start of the file, integer columns are promoted later if needed
+        with self._open_csv_file() as file:
+            sample = pd.read_csv(file, delimiter=';', quotechar='|', nrows=1000)
+        dtypes = [sample[header].dtype for header in headers] if sample.columns.tolist() == headers else []
+        if not dtypes or any(dtype.kind not in 'if' or dtype.itemsize != 8 for dtype in dtypes):
+            return None
+
+        byte_ranges = self._split_byte_ranges(data_start, data_stop, self._workers)
+        row_capacities = [self._count_lines(start, stop) for start, stop in byte_ranges]
+        first_rows = np.concatenate(([0], np.cumsum(row_capacities))).astype(int).tolist()
+        capacity = first_rows[-1]
+        if not capacity:
+            return None
+
+        block = shared_memory.SharedMemory(create=True, size=capacity * len(headers) * 8)
+        try:
+            results: Dict[int, Tuple[int, List[int]]] = {}
+            bytes_read = data_start
+            with ProcessPoolExecutor(max_workers=self._workers) as executor:
+                futures = {executor.submit(_parse_byte_range, self._filepath, start, stop, headers, [dtype.str for dtype in dtypes],
+                                           block.name, capacity, first_rows[nr]): nr for nr, (start, stop) in enumerate(byte_ranges)}
+                for future in as_completed(futures):
+                    nr = futures[future]
+                    results[nr] = future.result()
+                    if results[nr] is None:
+                        for pending_future in futures:
+                            pending_future.cancel()
+                        break
+                    bytes_read += byte_ranges[nr][1] - byte_ranges[nr][0]
+                    self._report_progress(bytes_read, data_stop, sum(rows for rows, _ in results.values()))
+            # A range with non-numeric values, the caller parses the whole file serially instead
+            if None in results.values():
+                block.close()
+                block.unlink()
+                return None
+
+            columns = [np.ndarray((capacity,), dtype=dtype, buffer=block.buf, offset=idx * capacity * 8) for idx, dtype in enumerate(dtypes)]
+            # Integer columns with missing or fractional values in any range become float64 columns
+            for idx in sorted({idx for _, promoted_idx_list in results.values() for idx in promoted_idx_list}):
+                float_column = np.ndarray((capacity,), dtype=np.float64, buffer=block.buf, offset=idx * capacity * 8)
+                for nr, (nr_of_rows, promoted_idx_list) in results.items():
+                    if idx not in promoted_idx_list:
+                        rows = slice(first_rows[nr], first_rows[nr] + nr_of_rows)
+                        float_column[rows] = columns[idx][rows].astype(np.float64)
+                columns[idx] = float_column
+
+            # Close the gaps left by blank lines so the rows of all ranges follow each other
+            nr_of_rows = 0
+            for nr in range(len(byte_ranges)):
+                range_rows = results[nr][0]
+                if first_rows[nr] != nr_of_rows:
+                    for column in columns:
+                        column[nr_of_rows:nr_of_rows + range_rows] = column[first_rows[nr]:first_rows[nr] + range_rows]
+                nr_of_rows += range_rows
+        except BaseException:
+            block.close()
+            block.unlink()
+            raise
+
+        # The mapping stays valid after unlinking, the memory is released with the last reference to the block
+        block.unlink()
+        self._shared_memory = block
+        return pd.DataFrame({header: column[:nr_of_rows] for header, column in zip(headers, columns)}, copy=False)
+
+    def __getstate__(self) -> Dict:
+        """ Drop the members which can not be pickled, e.g. when a CSVSession returns a manager from a worker process. """
+        state = self.__dict__.copy()
+        state['_shared_memory'] = None
+        state['_progress_callback'] = None
+        state['_memory_cache'] = MemoryCache(self._memory_cache.max_bytes)
+        return state
+
+    def _cache_key(self) -> str:
+        """ Build the cache key from the path, size, modification time and a hash of the file content. """
+        stat = os.stat(self._filepath)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{os.path.abspath(self._filepath)}|{stat.st_size}|{stat.st_mtime_ns}".encode())
+        with open(self._filepath, 'rb') as file:
+            digest.update(file.read(self._CACHE_HASH_SAMPLE_BYTES))
+            if stat.st_size > 2 * self._CACHE_HASH_SAMPLE_BYTES:
+                file.seek(-self._CACHE_HASH_SAMPLE_BYTES, os.SEEK_END)
+            digest.update(file.read())
+        return digest.hexdigest()
+
+    def _read_cache(self) -> Optional[pd.DataFrame]:
+        """ Memory-map the columns of a previously parsed file from the cache, if present. """
+        if not isinstance(self._filepath, str) or not os.path.isfile(self._filepath):
+            return None
+        entry_dir = os.path.join(self._cache_dir, self._cache_key())
+        meta_path = os.path.join(entry_dir, self._CACHE_META_FILE)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as file:
+                headers = json.load(file)['headers']
+            columns = {header: np.load(os.path.join(entry_dir, f"{idx}.npy"), mmap_mode='r').view(np.ndarray)
+                       for idx, header in enumerate(headers)}
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # Mark the entry as recently used for the eviction
+        os.utime(meta_path)
+        total_bytes = os.path.getsize(self._filepath)
+        self._report_progress(total_bytes, total_bytes, len(next(iter(columns.values()), ())))
+        return pd.DataFrame(columns, copy=False)
+
+    def _write_cache(self) -> None:
+        """ Store every column of the loaded file as a .npy file and evict old entries. """
+        # Object columns (e.g. date-time strings) can not be memory-mapped
+        if any(dtype == object for dtype in self._dataframe.dtypes):
+            return
+        os.makedirs(self._cache_dir, exist_ok=True)
+        key = self._cache_key()
+        entry_dir = os.path.join(self._cache_dir, key)
+        tmp_dir = f"{entry_dir}.tmp{os.getpid()}"
+        try:
+            os.makedirs(tmp_dir, exist_ok=True)
+            for idx, column in enumerate(self._headers):
+                np.save(os.path.join(tmp_dir, f"{idx}.npy"), self._dataframe[column].to_numpy())
+            with open(os.path.join(tmp_dir, self._CACHE_META_FILE), 'w', encoding='utf-8') as file:
+                json.dump({'source': os.path.abspath(self._filepath), 'headers': self._headers}, file)
+            # Replace a stale or incomplete entry with the same key
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(tmp_dir, entry_dir)
+        except OSError:
+            # Caching is an optimization only, a failure must not prevent loading the file
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+        self._evict_cache(keep=key)
+
+    def _evict_cache(self, keep: str) -> None:
+        """ Remove the least recently used entries until the cache fits into its size limit. """
+        entries = []
+        for entry in os.scandir(self._cache_dir):
+            meta_path = os.path.join(entry.path, self._CACHE_META_FILE)
+            if not entry.is_dir() or not os.path.isfile(meta_path):
+                continue
+            size = sum(file.stat().st_size for file in os.scandir(entry.path))
+            entries.append((os.path.getmtime(meta_path), entry.name, size))
+
+        total_size = sum(size for _, _, size in entries)
+        for _, name, size in sorted(entries):
+            if total_size <= self._cache_max_bytes:
+                break
+            if name != keep:
+                shutil.rmtree(os.path.join(self._cache_dir, name), ignore_errors=True)
+                total_size -= size
+
+    def _load_columns(self, headers: List[str]) -> None:
+        """ Load all not yet loaded columns of the given headers in a single pass over the file. """
+        missing_headers = [header for header in headers if header not in self._dataframe.columns and header not in self._rle_columns]
+        if not missing_headers:
+            return
+        data = pd.read_csv(self._filepath, delimiter=';', quotechar='|', usecols=missing_headers)
+        self._dataframe = data if self._dataframe.columns.empty else pd.concat([self._dataframe, data], axis=1)
+
     def _validate_index(self, idx: int) -> None:
         if isinstance(idx, int) and (idx < 0 or self._nr_of_data <= idx):
             raise IndexError(f"Index '{idx}' out of range.")
 
     def _validate_header(self, hdr: int) -> None:
-        if isinstance(hdr, str) and hdr not in self.header_list:
+        if isinstance(hdr, str) and hdr not in self._schema:
             raise ValueError(f"Header '{hdr}' not found")
 
     def _validate_input(self, idx: int = None, hdr: str = None) -> None:
@@ -62,12 +1088,24 @@ class CSVDataManager:
     def _get_data_by_header(self, header: str) -> Optional[pd.Series]:
         """ Get data for a specific header, handling the case where the header does not exist. """
         self._validate_header(header)
-        return self._dataframe.get(header)
+        return self._get_column(header)
 
     def _get_data_by_index(self, index: int) -> Optional[pd.Index]:
         """ Get data for a specific index. """
         self._validate_index(index)
-        return self._dataframe.iloc[:, index]
+        return self._get_column(self._headers[index])
+
+    def _get_column(self, header: str) -> pd.Series:
+        """ Get a column, loaded on demand in lazy mode and expanded if it is run-length encoded. """
+        if header in self._rle_columns:
+            data = self._memory_cache.get(('expanded', header))
+            if data is None:
+                data = self._rle_columns[header].to_array()
+                data.flags.writeable = False
+                self._memory_cache.put(('expanded', header), data, data.nbytes)
+            return pd.Series(data, name=header, copy=False)
+        self._load_columns([header])
+        return self._dataframe[header]
 
     def _get_raw_data(self, idx: int = None, hdr: str = None) -> Optional[pd.Index] | Optional[pd.Series]:
         self._validate_input(idx, hdr)
@@ -77,110 +1115,224 @@ class CSVDataManager:
         return data
 
     @staticmethod
-    def _parse_time(raw_time: float) -> Tuple[float, float, float]:
-        """Parse time data from timestamp or date-time format to hours, minutes, seconds."""
-        raw_time = format(raw_time, '.3f')
-        try:
-            parsed_time = str(datetime.datetime.utcfromtimestamp(int(str(raw_time).replace('.', '')) / 1e3)).split()[1].split(':')
-        except ValueError:
-            parsed_time = str(raw_time).split()[1].split(':')
-
-        return tuple(map(float, parsed_time))
+    def _time_in_milliseconds(raw_time: pd.Series) -> np.ndarray:
+        """ Convert a whole column of timestamps or date-time strings to the integer milliseconds since the epoch.
+        Unlike the time of day, the result keeps increasing across midnight. """
+        if pd.api.types.is_numeric_dtype(raw_time):
+            # Timestamps are rounded to milliseconds, the same as formatting them with three decimals
+            return np.round(raw_time.to_numpy(dtype=np.float64) * 1e3).astype(np.int64)
 
-    def _calculate_time_in_seconds(self, raw_time: float, time_offset: List[float]) -> float:
-        """Convert parsed time to total seconds."""
-        hr, _min, sec = self._parse_time(raw_time)
-        return round((hr - time_offset[0]) * 3600 + (_min - time_offset[1]) * 60 + sec - time_offset[2], 3)
+        date_time = pd.to_datetime(raw_time).dt.round('ms').dt.as_unit('ms')
+        return date_time.to_numpy().astype(np.int64)
 
     @property
     def header_list(self) -> List[str]:
         """ Get the list of headers from the CSV file. """
-        return self._dataframe.columns.tolist()
+        return list(self._headers)
 
     @property
     def index_list(self) -> List[str]:
         """ Get the list of headers from the CSV file. """
-        return list(range(len(self.header_list)))
+        return list(range(len(self._schema)))
 
     @property
-    def headers_mapping(self) -> Optional[Dict[str, List[Union[str, int]]]]:
-        """ Create a mapping of header names to their indices with groupheader and header keys. """
-        hdr_mapping: Dict[str, List[Union[str, int]]] = {}
+    def memory_cache(self) -> MemoryCache:
+        """ Get the cache of converted columns and derived products, e.g. to read its hit and miss counters. """
+        return self._memory_cache
 
-        for idx, header in enumerate(self.header_list):
-            strpped_header = header.replace(self._prefix, '') if self._prefix in header else header
-            group_header, header_key = strpped_header.split('::') if '::' in strpped_header else (None, strpped_header)
-            hdr_mapping.setdefault(group_header, []).append([header_key, idx])
+    @property
+    def schema(self) -> CSVSchema:
+        """ Get the immutable headers, header lookup, headers mapping and column types of the file. """
+        return self._schema
 
-        return hdr_mapping
+    @property
+    def headers_mapping(self) -> Optional[HeadersMapping]:
+        """ Get the mapping of header names to their indices with groupheader and header keys, built once at load. """
+        return self._schema.headers_mapping
 
     @property
-    def const_data_index_list(self) -> Optional[List[int]]:
-        """ Get the list of constant column indices from the CSV file. """
-        const_data_idx_list: List[int] = []
+    def column_profile(self) -> ColumnProfile:
+        """ Get the statistics of all columns, computed once per file. """
+        if self._profile is None:
+            self._load_columns(self._headers)
+            self._profile = ColumnProfile.from_dataframe(self._dataframe, self._headers)
 
-        for idx, column in enumerate(self._dataframe.columns):
-            datafram_col = self._dataframe[column]
-            # All values are equal to the first value
-            if (datafram_col == datafram_col.iloc[0]).all():
-                # Store the index of the constant data
-                const_data_idx_list.append(idx)
+        return self._profile
 
-        return const_data_idx_list
+    @property
+    def is_profiled(self) -> bool:
+        """ Check whether the column profile is computed, so reading it costs nothing,
+        e.g. a lazy manager is only profiled on request because that loads every column. """
+        return self._profile is not None
+
+    @property
+    def const_data_index_list(self) -> Optional[List[int]]:
+        """ Get the list of constant column indices from the CSV file. """
+        return np.flatnonzero(self.column_profile.is_constant).tolist()
 
     @property
     def const_zero_data_index_list(self) -> Optional[List[int]]:
         """ Get the list of constant zero column indices from the CSV file. """
-        const_zero_data_idx_list: List[int] = []
+        return np.flatnonzero(self.column_profile.is_zero).tolist()
 
-        for idx, column in enumerate(self._dataframe.columns):
-            if (self._dataframe[column] == 0).all():
-                # Store the index of the constant zero data
-                const_zero_data_idx_list.append(idx)
+    @property
+    def varying_data_index_list(self) -> List[int]:
+        """ Get the list of varying (not constant) column indices from the CSV file. """
+        return np.flatnonzero(~self.column_profile.is_constant).tolist()
 
-        return const_zero_data_idx_list
+    @property
+    def time_data_array(self) -> np.ndarray:
+        """ Get the time data relative to the first row in seconds as a read-only array.
+        The whole column is converted at once and the result is cached. """
+        if self._time_data is None:
+            milliseconds = self._time_in_milliseconds(self._get_raw_data(hdr='time index'))
+            if len(milliseconds):
+                self._time_origin_ms = int(milliseconds[0])
+            # The differences are exact integers, so only the division rounds
+            time_data = (milliseconds - (self._time_origin_ms or 0)) / 1e3
+            time_data.flags.writeable = False
+            self._time_data = time_data
+
+        return self._time_data
 
     @property
-    def varying_data_index_list(self) -> List[int]:
-        """ Get the indices of constant zero data. """
-        return [set(self.const_data_index_list) ^ set(self.index_list)]
+    def time_origin(self) -> float:
+        """ Get the absolute time of the first row in seconds since the epoch. """
+        raw_time = self._get_raw_data(hdr='time index')
+        if not len(raw_time):
+            raise ValueError(f"No time data in file: {self._filepath}")
+        if pd.api.types.is_numeric_dtype(raw_time):
+            return round(float(raw_time.iloc[0]), 3)
+        return pd.Timestamp(raw_time.iloc[0]).timestamp()
 
     @property
     def time_data_list(self) -> List[float]:
         """Extract time data from the CSV and convert it to seconds."""
-        time_data_list: List[float] = [0.0]
-
-        data = self.get_data(hdr='time index')
-        time_offset = self._parse_time(data[0])
-        for row in data[1:]:
-            time_data_list.append(self._calculate_time_in_seconds(row, time_offset))
-
-        return time_data_list
+        return self.time_data_array.tolist()
 
     def get_header(self, index: int) -> str:
         """ Get the header of the corresponding index from the CSV file. """
         self._validate_index(index)
-        return str(self._dataframe.columns[index])
+        return str(self._headers[index])
 
     def get_index(self, header: str) -> int:
         """ Get the index of the corresponding header from the CSV file. """
         self._validate_header(header)
-        return int(self._dataframe.columns.get_loc(header))
+        return self._schema.index_of(header)
+
+    def load_columns(self, idx_list: Optional[List[int]] = None, hdr_list: Optional[List[str]] = None) -> None:
+        """ Load the columns of the given indices and headers in one pass over the file.
+        Only needed in lazy mode to batch the loading of several signals, e.g. before plotting them. """
+        self._load_columns(self._resolve_headers(idx_list, hdr_list))
+
+    def _resolve_headers(self, idx_list: Optional[List[int]] = None, hdr_list: Optional[List[str]] = None) -> List[str]:
+        """ Validate the indices and headers at once and get the headers of the indices followed by the headers. """
+        idx_list, hdr_list = idx_list or [], hdr_list or []
+        for idx in idx_list:
+            if not isinstance(idx, (int, np.integer)) or isinstance(idx, bool):
+                raise ValueError(f"Index '{idx}' is not an integer.")
+            self._validate_index(int(idx))
+        for hdr in hdr_list:
+            if hdr not in self._schema:
+                raise ValueError(f"Header '{hdr}' not found")
+        return [self._headers[idx] for idx in idx_list] + list(hdr_list)
+
+    def compact_columns(self, max_runs_ratio: float = 0.01) -> int:
+        """ Move every column with at most max_runs_ratio runs per row, e.g. constant signals and rarely changing flags,
+        from the DataFrame into run-length encoded storage. They are expanded to dense arrays only when requested.
+        Returns the number of moved columns. """
+        if self._lazy or self._follow:
+            raise ValueError("The run-length encoded storage can not be combined with the lazy or the follow mode.")
+        # The profile needs the dense columns, so it is computed before
+        _ = self.column_profile
+        max_runs = max(1, int(len(self._dataframe) * max_runs_ratio))
+        compact_headers = [header for header in self._dataframe.columns
+                           if RunLengthColumn.count_runs(self._dataframe[header].to_numpy()) <= max_runs]
+        for header in compact_headers:
+            self._rle_columns[header] = RunLengthColumn.from_array(self._dataframe[header].to_numpy())
+        self._dataframe = self._dataframe.drop(columns=compact_headers)
+
+        return len(compact_headers)
+
+    def get_transitions(self, idx: int = None, hdr: str = None) -> Tuple[np.ndarray, np.ndarray]:
+        """ Get the times in seconds at which a signal changes its value and the new values,
+        starting with the value at the first row. Run-length encoded columns answer without expanding. """
+        self._validate_input(idx, hdr)
+        header = hdr if hdr is not None else self._headers[idx]
+        column = self._rle_columns.get(header) or RunLengthColumn.from_array(self.get_array(hdr=header))
+        return self.time_data_array[column.starts], column.values
+
+    def get_array(self, idx: int = None, hdr: str = None) -> np.ndarray:
+        ''' Get the data from the CSV file as a read-only NumPy array in its native dtype.
+        The array is a view on the loaded column, no data is copied. '''
+        data = self._get_raw_data(idx, hdr).to_numpy().view()
+        data.flags.writeable = False
+        return data
 
     def get_data(self, idx: int = None, hdr: str = None) -> List[float]:
-        ''' Get the data from the CSV file as a list of floats. '''
-        data = self._get_raw_data(idx, hdr)
-        return [float(value) for value in data]
+        ''' Get the data from the CSV file as a list of floats.
+        The conversion is cached, repeated calls only copy the cached list. '''
+        self._validate_input(idx, hdr)
+        idx = idx if idx is not None else self._schema.index_of(hdr)
+        data = self._memory_cache.get(('data', idx))
+        if data is None:
+            data = self.get_array(idx=idx).astype(np.float64, copy=False).tolist()
+            self._memory_cache.put(('data', idx), data, len(data) * self._FLOAT_LIST_ITEM_BYTES)
+        return list(data)
 
-    def get_data_extrema(self, idx: Optional[int] = None, hdr: Optional[str] = None) -> Tuple[float, float]:
+    def get_arrays(self, idx_list: Optional[List[int]] = None, hdr_list: Optional[List[str]] = None,
+                   t_start: Optional[float] = None, t_end: Optional[float] = None,
+                   dtype: np.dtype = np.float64) -> Tuple[np.ndarray, np.ndarray]:
+        """ Get the time data and the data of several signals, e.g. a whole group of headers_mapping, in one call.
+        The signals are validated once and copied into one contiguous array with a row per signal,
+        the signals of idx_list first, followed by the signals of hdr_list.
+        If t_start or t_end is given, only the rows within that time window are returned. """
+        headers = self._resolve_headers(idx_list, hdr_list)
+        if not headers:
+            raise ValueError("At least one index or header name must be provided.")
+        self._load_columns(headers)
+        start, stop = self._time_window(t_start, t_end)
+
+        data = np.empty((len(headers), stop - start), dtype=dtype)
+        for row, header in enumerate(headers):
+            if header in self._rle_columns:
+                data[row] = self._rle_columns[header].to_array(start, stop)
+            else:
+                data[row] = self._dataframe[header].to_numpy()[start:stop]
+
+        return self.time_data_array[start:stop], data
+
+    def get_data_extrema(self, idx: Optional[int] = None, hdr: Optional[str] = None, t_start: Optional[float] = None,
+                         t_end: Optional[float] = None) -> Tuple[float, float]:
         """ Calculate the maxima and minima of the data for either a given index or header.
+        If t_start or t_end is given, only the data within that time window (e.g. the visible part of a chart) is considered.
         Adds a buffer to avoid the data being at the very top or bottom of the chart.
         For a constant signal, especially zero, provides a default small range around the value. """
-        data = self._get_raw_data(idx, hdr)
+        self._validate_input(idx, hdr)
+        idx = idx if idx is not None else self.get_index(hdr)
+
+        # Calculate extrema, in lazy mode without loading every column for the profile
+        if t_start is not None or t_end is not None:
+            start, stop = self._time_window(t_start, t_end)
+            if start == stop:
+                raise ValueError(f"No data in time window [{t_start}, {t_end}].")
+            extrema = self._memory_cache.get(('extrema', idx, start, stop))
+            if extrema is None:
+                rle_column = self._rle_columns.get(self._headers[idx])
+                extrema = (rle_column or self._get_pyramid(idx)).range_extrema(start, stop)
+                self._memory_cache.put(('extrema', idx, start, stop), extrema, 16)
+            min_val, max_val = extrema
+        elif self._profile is None and self._lazy:
+            data = self.get_array(idx=idx)
+            min_val, max_val = float(np.nanmin(data)), float(np.nanmax(data))
+        else:
+            min_val, max_val = float(self.column_profile.minimum[idx]), float(self.column_profile.maximum[idx])
 
-        # Calculate extrema
-        min_val, max_val = min(data), max(data)
+        return self._pad_extrema(min_val, max_val)
 
+    @staticmethod
+    def _pad_extrema(min_val: float, max_val: float) -> Tuple[float, float]:
+        """ Add the chart buffer to the extrema of a signal. """
         # Handle constant signal, especially zero
         if min_val == max_val:
             # Provide a range around the constant value
@@ -189,6 +1341,149 @@ class CSVDataManager:
         buffer = abs(0.05 * (max_val - min_val))
         return round(min_val - buffer, 3), round(max_val + buffer, 3)
 
+    def _time_window(self, t_start: Optional[float] = None, t_end: Optional[float] = None) -> Tuple[int, int]:
+        """ Get the row range [start, stop) of the time window in seconds relative to the first row. """
+        time_data = self.time_data_array
+        start = 0 if t_start is None else int(np.searchsorted(time_data, t_start, side='left'))
+        stop = len(time_data) if t_end is None else int(np.searchsorted(time_data, t_end, side='right'))
+        return start, max(start, stop)
+
+    def get_decimated_data(self, idx: Optional[int] = None, hdr: Optional[str] = None, t_start: Optional[float] = None,
+                           t_end: Optional[float] = None, width: int = 1000, method: str = 'minmax') -> Tuple[np.ndarray, np.ndarray]:
+        """ Get the time and data of a signal within a time window, reduced to at most two points per pixel of width.
+        'minmax' keeps the minimum and maximum of every bucket so peaks stay visible,
+        'lttb' keeps the visually most significant point of every bucket,
+        'pyramid' reads the minimum and maximum of every bucket from the precomputed pyramid of the signal
+        and places both at the start of the bucket.
+        The results are cached and read-only. """
+        self._validate_input(idx, hdr)
+        if method not in DECIMATION_METHODS:
+            raise ValueError(f"Unknown decimation method '{method}', expected one of {DECIMATION_METHODS}.")
+        if not isinstance(width, int) or width < 1:
+            raise ValueError(f"Width '{width}' must be a positive integer.")
+
+        idx = idx if idx is not None else self._schema.index_of(hdr)
+        start, stop = self._time_window(t_start, t_end)
+        key = ('decimated', idx, start, stop, width, method)
+        decimated = self._memory_cache.get(key)
+        if decimated is not None:
+            return decimated
+
+        if method == 'pyramid':
+            rows, minima, maxima = self._get_pyramid(idx).decimate(start, stop, width)
+            decimated = np.repeat(self.time_data_array[rows], 2), np.stack([minima, maxima], axis=1).ravel()
+        else:
+            time_data, data = self.time_data_array[start:stop], self.get_array(idx=idx)[start:stop]
+            if method == 'lttb':
+                decimated = _decimate_lttb(time_data, data, 2 * width)
+            else:
+                decimated = _decimate_min_max(time_data, data, width)
+        for array in decimated:
+            array.flags.writeable = False
+
+        return self._memory_cache.put(key, decimated, sum(array.nbytes for array in decimated))
+
+    def _store_pyramid(self, index: int, pyramid: MinMaxPyramid) -> MinMaxPyramid:
+        """ Store a pyramid in the memory cache. """
+        return self._memory_cache.put(('pyramid', index), pyramid, pyramid.nbytes)
+
+    def _get_pyramid(self, index: int) -> MinMaxPyramid:
+        """ Get the min/max pyramid of a column, built on first use. """
+        pyramid = self._memory_cache.get(('pyramid', index))
+        if pyramid is None:
+            pyramid = self._store_pyramid(index, MinMaxPyramid.from_array(self.get_array(idx=index)))
+
+        return pyramid
+
+    def save_pyramids(self, filepath: Optional[str] = None) -> str:
+        """ Save the pyramids built so far next to the CSV file, or to the given file. """
+        filepath = filepath or f"{self._filepath}{self._PYRAMID_FILE_SUFFIX}"
+        levels = {'stamp': _file_stamp(self._filepath)}
+        for (_, index), pyramid in self._memory_cache.items('pyramid'):
+            for level in range(1, len(pyramid.minima)):
+                levels[f"{index}_min_{level}"] = pyramid.minima[level]
+                levels[f"{index}_max_{level}"] = pyramid.maxima[level]
+        with open(filepath, 'wb') as file:
+            np.savez(file, **levels)
+
+        return filepath
+
+    def load_pyramids(self, filepath: Optional[str] = None) -> bool:
+        """ Load pyramids saved next to the CSV file, or from the given file.
+        Returns False if there is no such file or if it belongs to an older version of the CSV file. """
+        filepath = filepath or f"{self._filepath}{self._PYRAMID_FILE_SUFFIX}"
+        try:
+            with np.load(filepath) as levels:
+                if not np.array_equal(levels['stamp'], _file_stamp(self._filepath)):
+                    return False
+                names = [name.split('_') for name in levels.files if name != 'stamp']
+                indices = sorted({int(index) for index, _, _ in names})
+                # In lazy mode the columns of all saved pyramids are loaded in one pass over the file
+                self.load_columns(idx_list=indices)
+                for index in indices:
+                    nr_of_levels = 1 + sum(1 for name in names if name[0] == str(index) and name[1] == 'min')
+                    data = self.get_array(idx=index)
+                    minima = [data] + [levels[f"{index}_min_{level}"] for level in range(1, nr_of_levels)]
+                    maxima = [data] + [levels[f"{index}_max_{level}"] for level in range(1, nr_of_levels)]
+                    # Levels which do not cover every row, e.g. saved by an older version, are rebuilt on demand
+                    if any(len(level) != -(-len(data) >> nr) for nr, level in enumerate(minima)):
+                        return False
+                    self._store_pyramid(index, MinMaxPyramid(minima, maxima))
+        except (OSError, KeyError, ValueError):
+            return False
+
+        return True
+
+    def build_row_index(self, every: int = 1000) -> RowOffsetIndex:
+        """ Get the byte offset index of every n-th row, loaded from its sidecar file next to the CSV file
+        if that is still valid, otherwise built and saved as sidecar file. """
+        sidecar_filepath = f"{self._filepath}{self._ROW_INDEX_FILE_SUFFIX}"
+        if self._row_index is None or self._row_index.every != every \
+                or not np.array_equal(self._row_index.stamp, _file_stamp(self._filepath)):
+            self._row_index = RowOffsetIndex.load(sidecar_filepath, self._filepath)
+            if self._row_index is None or self._row_index.every != every:
+                self._row_index = RowOffsetIndex.build(self._filepath, every)
+                try:
+                    self._row_index.save(sidecar_filepath)
+                except OSError:
+                    # Without a sidecar file the index is built again next time
+                    pass
+
+        return self._row_index
+
+    def read_time_window(self, t_start: Optional[float] = None, t_end: Optional[float] = None,
+                         hdr_list: Optional[List[str]] = None) -> pd.DataFrame:
+        """ Parse only the rows of the time window in seconds relative to the first row, optionally only some columns.
+        The rows are located with the row index, so the rest of the file is neither read nor parsed. """
+        for hdr in hdr_list or []:
+            self._validate_header(hdr)
+        row_index = self._row_index or self.build_row_index()
+        if not len(row_index.offsets):
+            return pd.DataFrame(columns=hdr_list or self._headers)
+
+        start, stop = row_index.byte_range(t_start, t_end)
+        with open(self._filepath, 'rb') as file:
+            file.seek(start)
+            window_bytes = file.read() if stop is None else file.read(stop - start)
+        usecols = None if hdr_list is None else list(dict.fromkeys(['time index'] + hdr_list))
+        data = pd.read_csv(io.BytesIO(window_bytes), delimiter=';', quotechar='|', header=None, names=self._headers, usecols=usecols)
+
+        # The indexed rows only bound the window, the rows outside of it are dropped
+        raw_time = data['time index']
+        if pd.api.types.is_numeric_dtype(raw_time):
+            time_data = raw_time.to_numpy(dtype=np.float64) - row_index.timestamps[0]
+        else:
+            time_data = pd.to_datetime(raw_time).map(pd.Timestamp.timestamp).to_numpy(dtype=np.float64) - row_index.timestamps[0]
+        time_data = np.round(time_data, 3)
+        in_window = np.ones(len(data), dtype=bool)
+        if t_start is not None:
+            in_window &= time_data >= t_start
+        if t_end is not None:
+            in_window &= time_data <= t_end
+        data = data[in_window].reset_index(drop=True)
+
+        return data if hdr_list is None else data[hdr_list]
+
     def get_unique_color_code(self, index: int) -> int:
         """Calculate color based on the subheading number using HSL."""
         self._validate_index(index)
@@ -210,6 +1505,123 @@ class CSVDataManager:
         return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
 
 
+def _load_csv_data_manager(filepath: str, kwargs: Dict) -> CSVDataManager:
+    """ Load a CSV file, runs in a worker process of CSVSession. """
+    return CSVDataManager(filepath, **kwargs)
+
+
+class CSVSession:
+    ''' Several CSV files of one bench run, e.g. TelemetryUI_log_<timestamp>.csv, as one continuous timeline.
+    The files are loaded in parallel and ordered by their first timestamp. Data is concatenated per requested column,
+    the files are never merged into one DataFrame.
+    A progress_callback is not passed on to the worker processes, it is called in this process whenever a file
+    has been loaded, with the bytes and rows of all loaded files. '''
+    def __init__(self, filepaths: List[str], processes: Optional[int] = None, **kwargs):
+        if not filepaths:
+            raise ValueError("At least one file path must be provided.")
+
+        progress_callback: Optional[ProgressCallback] = kwargs.pop('progress_callback', None)
+        file_sizes = [os.path.getsize(filepath) if os.path.isfile(filepath) else 0 for filepath in filepaths]
+        progress = [0, sum(file_sizes), 0]
+
+        def report_loaded(nr: int, manager: CSVDataManager) -> CSVDataManager:
+            progress[0] += file_sizes[nr]
+            progress[2] += len(manager._dataframe)
+            if progress_callback is not None:
+                progress_callback(*progress)
+            return manager
+
+        if len(filepaths) == 1 or processes == 1:
+            managers = [report_loaded(nr, CSVDataManager(filepath, **kwargs)) for nr, filepath in enumerate(filepaths)]
+        else:
+            managers = [None] * len(filepaths)
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                futures = {executor.submit(_load_csv_data_manager, filepath, kwargs): nr for nr, filepath in enumerate(filepaths)}
+                for future in as_completed(futures):
+                    managers[futures[future]] = report_loaded(futures[future], future.result())
+
+        for filepath, manager in zip(filepaths[1:], managers[1:]):
+            if manager.header_list != managers[0].header_list:
+                raise ValueError(f"The headers of {filepath} do not match the headers of {filepaths[0]}.")
+
+        self._managers: List[CSVDataManager] = sorted(managers, key=lambda manager: manager.time_origin)
+        self._time_data: Optional[np.ndarray] = None
+
+    @property
+    def managers(self) -> List[CSVDataManager]:
+        """ Get the managers of the files in time order. """
+        return list(self._managers)
+
+    @property
+    def header_list(self) -> List[str]:
+        """ Get the list of headers shared by all files. """
+        return self._managers[0].header_list
+
+    @property
+    def index_list(self) -> List[int]:
+        """ Get the list of indices shared by all files. """
+        return self._managers[0].index_list
+
+    @property
+    def schema(self) -> CSVSchema:
+        """ Get the schema of the first file, all files share its headers. """
+        return self._managers[0].schema
+
+    @property
+    def headers_mapping(self) -> Optional[HeadersMapping]:
+        """ Get the mapping of group headers to header keys and indices shared by all files. """
+        return self._managers[0].headers_mapping
+
+    def get_header(self, index: int) -> str:
+        """ Get the header of the corresponding index. """
+        return self._managers[0].get_header(index)
+
+    def get_index(self, header: str) -> int:
+        """ Get the index of the corresponding header. """
+        return self._managers[0].get_index(header)
+
+    @property
+    def time_data_array(self) -> np.ndarray:
+        """ Get the time data of all files relative to the first row of the first file in seconds as a read-only array. """
+        if self._time_data is None:
+            time_origin = self._managers[0].time_origin
+            time_data = np.concatenate([np.round(manager.time_data_array + (manager.time_origin - time_origin), 3)
+                                        for manager in self._managers])
+            time_data.flags.writeable = False
+            self._time_data = time_data
+
+        return self._time_data
+
+    @property
+    def time_data_list(self) -> List[float]:
+        """ Get the time data of all files relative to the first row of the first file in seconds. """
+        return self.time_data_array.tolist()
+
+    def get_array(self, idx: int = None, hdr: str = None) -> np.ndarray:
+        """ Get the data of all files as a read-only NumPy array. """
+        data = np.concatenate([manager.get_array(idx, hdr) for manager in self._managers])
+        data.flags.writeable = False
+        return data
+
+    def get_data(self, idx: int = None, hdr: str = None) -> List[float]:
+        """ Get the data of all files as a list of floats. """
+        return self.get_array(idx, hdr).astype(np.float64, copy=False).tolist()
+
+    def get_arrays(self, idx_list: Optional[List[int]] = None, hdr_list: Optional[List[str]] = None,
+                   dtype: np.dtype = np.float64) -> Tuple[np.ndarray, np.ndarray]:
+        """ Get the time data and the data of several signals of all files with a row per signal. """
+        data = np.concatenate([manager.get_arrays(idx_list, hdr_list, dtype=dtype)[1] for manager in self._managers], axis=1)
+        return self.time_data_array, data
+
+    def get_data_extrema(self, idx: Optional[int] = None, hdr: Optional[str] = None) -> Tuple[float, float]:
+        """ Calculate the buffered minima and maxima of the data of all files from the profiles of the files. """
+        self._managers[0]._validate_input(idx, hdr)
+        idx = idx if idx is not None else self.get_index(hdr)
+        min_val = float(np.fmin.reduce([manager.column_profile.minimum[idx] for manager in self._managers]))
+        max_val = float(np.fmax.reduce([manager.column_profile.maximum[idx] for manager in self._managers]))
+        return CSVDataManager._pad_extrema(min_val, max_val)
+
+
 if __name__ == '__main__':
     csv_manager = CSVDataManager('resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv')
 
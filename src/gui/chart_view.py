@@ -1,10 +1,283 @@
 ''' Handles the matplotlib chart embedding and interactions.'''
+from typing import Callable, Dict, List, Optional, Tuple
+import math
+import numpy as np
 import customtkinter as ctk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.artist import Artist
+from matplotlib.backend_bases import DrawEvent, MouseEvent
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.patches import Rectangle
+from csv_data_manager import CSVDataManager
 
 
 class ChartView(ctk.CTkFrame):
-    ''' Manage the list of CSV headers. '''
-    def __init__(self, parent):
+    ''' Plot signals and draw the interactive overlays of the chart.
+    The signals are drawn by a pool of Line2D artists whose data is replaced with set_data, so showing another signal
+    does not create artists. The figure without the overlays is cached as background after every full draw.
+    The cursor, the hover marker and the selection rectangle are animated artists which are drawn onto the restored
+    background and blitted, so moving them costs one blit instead of a redraw of every line.
+    Signals plotted by header are decimated again for the visible time range after panning or zooming,
+    either with the navigation toolbar or by selecting a time range, which zooms to it unless on_select is given. '''
+    # Relative margin added above and below the data of the visible signals
+    _Y_MARGIN: float = 0.05
+    # Quiet time after the last change of the x-axis limits before the visible range is decimated again
+    _REDECIMATE_DELAY_MS: int = 150
+    # Number of grid steps per quantized view span, the decimated range is extended by one step on both sides
+    _RANGE_GRID_STEPS: int = 4
+    _DECIMATION_METHOD: str = 'pyramid'
+
+    def __init__(self, parent, on_select: Optional[Callable[[float, float], None]] = None):
         super().__init__(parent)
+
+        # Init members
+        self._on_select = on_select if on_select is not None else self.set_time_range
+        self._signals: Dict[str, Line2D] = {}
+        self._line_pool: List[Line2D] = []
+        self._background = None
+        self._selection_start: Optional[float] = None
+        self._csv_data_manager: Optional[CSVDataManager] = None
+        # Signals plotted by header: the quantized span and the time range of their decimated data
+        self._decimated_ranges: Dict[str, Tuple[float, float, float]] = {}
+        self._redecimate_id: Optional[str] = None
+
+        # Configure the positioning
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=0)
+
+        # Initilize widgets
+        self.figure = Figure()
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self)
+        # Sets canvas.toolbar, so selecting a time range is disabled while panning or zooming with it
+        self.toolbar = NavigationToolbar2Tk(self.canvas, self, pack_toolbar=False)
+        self.axes = self.figure.add_subplot()
+        self._init_overlays()
+        self._connect_events()
+
+        # Layout widgets
+        self.canvas.get_tk_widget().grid(row=0, column=0, sticky='news')
+        self.toolbar.grid(row=1, column=0, sticky='ew')
+
+    def _init_overlays(self) -> None:
+        ''' Create the animated overlays, they are excluded from the full draws and the autoscaling. '''
+        self.cursor_line = Line2D([0, 0], [0, 1], transform=self.axes.get_xaxis_transform(), color='grey', linewidth=0.8)
+        self.hover_marker = Line2D([], [], marker='o', markersize=6, linestyle='', color='black')
+        self.selection_rectangle = Rectangle((0, 0), 0, 1, transform=self.axes.get_xaxis_transform(), alpha=0.2)
+        self._overlays: List[Artist] = [self.cursor_line, self.hover_marker, self.selection_rectangle]
+        for overlay in self._overlays:
+            overlay.set_animated(True)
+            overlay.set_visible(False)
+            self.axes.add_artist(overlay)
+
+    def _connect_events(self) -> None:
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('motion_notify_event', self._on_motion)
+        self.canvas.mpl_connect('button_press_event', self._on_press)
+        self.canvas.mpl_connect('button_release_event', self._on_release)
+        self.canvas.mpl_connect('figure_leave_event', self._on_leave)
+        self.axes.callbacks.connect('xlim_changed', self._on_xlim_changed)
+
+    @property
+    def signal_keys(self) -> List[str]:
+        ''' Get the keys of the plotted signals. '''
+        return list(self._signals)
+
+    def plot_signal(self, key: str, time_data: np.ndarray, data: np.ndarray, label: Optional[str] = None,
+                    color: Optional[str] = None) -> None:
+        ''' Plot a signal, or replace the data of an already plotted one, and rescale the axes.
+        A line of the pool is reused if one is free. '''
+        line = self._signals.get(key)
+        if line is None:
+            line = self._line_pool.pop() if self._line_pool else self.axes.add_line(Line2D([], []))
+            self._signals[key] = line
+        line.set_data(time_data, data)
+        line.set_label(label or key)
+        if color is not None:
+            line.set_color(color)
+        line.set_visible(True)
+        self._autoscale()
+        self.redraw()
+
+    def set_data_manager(self, csv_data_manager: Optional[CSVDataManager]) -> None:
+        ''' Set the file whose signals are plotted by header, the signals of the previous file are removed. '''
+        self.clear()
+        # The views of the previous file are no longer valid
+        self.toolbar.update()
+        self._csv_data_manager = csv_data_manager
+
+    def plot_header(self, header: str) -> None:
+        ''' Plot a signal of the data manager over the whole time range, decimated to the width of the axes. '''
+        time_data = self._csv_data_manager.time_data_array
+        if not len(time_data):
+            return
+        decimated_range = self._quantize_range(float(time_data[0]), float(time_data[-1]))
+        self.plot_signal(header, *self._get_decimated_data(header, decimated_range),
+                         color=self._csv_data_manager.get_unique_color_code(self._csv_data_manager.get_index(header)))
+        self._decimated_ranges[header] = decimated_range
+
+    def _quantize_range(self, x_min: float, x_max: float) -> Tuple[float, float, float]:
+        ''' Round the view span up to a power of two and extend the range to its grid with one step of margin,
+        so views close to each other request the same range and width, which the data manager has cached. '''
+        span = 2.0 ** math.ceil(math.log2(max(x_max - x_min, 1e-3)))
+        step = span / self._RANGE_GRID_STEPS
+        return span, (math.floor(x_min / step) - 1) * step, (math.ceil(x_max / step) + 1) * step
+
+    def _get_decimated_data(self, header: str, decimated_range: Tuple[float, float, float]) -> Tuple[np.ndarray, np.ndarray]:
+        span, t_start, t_end = decimated_range
+        width = max(1, int(self.axes.bbox.width * (t_end - t_start) / span))
+        return self._csv_data_manager.get_decimated_data(hdr=header, t_start=t_start, t_end=t_end, width=width,
+                                                         method=self._DECIMATION_METHOD)
+
+    def _on_xlim_changed(self, axes=None) -> None:
+        ''' Debounce the changes of the x-axis limits while panning or zooming. '''
+        if not self._decimated_ranges:
+            return
+        if self._redecimate_id is not None:
+            self.after_cancel(self._redecimate_id)
+        self._redecimate_id = self.after(self._REDECIMATE_DELAY_MS, self._redecimate)
+
+    def _redecimate(self) -> None:
+        ''' Decimate the signals plotted by header again for the visible range,
+        unless their data already covers it at the same resolution. '''
+        self._redecimate_id = None
+        x_min, x_max = sorted(self.axes.get_xlim())
+        decimated_range = self._quantize_range(x_min, x_max)
+        changed = False
+        for header, (span, t_start, t_end) in self._decimated_ranges.items():
+            if span == decimated_range[0] and t_start <= x_min and x_max <= t_end:
+                continue
+            self._signals[header].set_data(*self._get_decimated_data(header, decimated_range))
+            self._decimated_ranges[header] = decimated_range
+            changed = True
+        if changed:
+            self.redraw()
+
+    def set_time_range(self, t_start: float, t_end: float) -> None:
+        ''' Zoom to a time range, the previous view stays on the navigation stack of the toolbar. '''
+        self.toolbar.push_current()
+        self.axes.set_xlim(t_start, t_end)
+        self.toolbar.push_current()
+        self.redraw()
+
+    def update_signal(self, key: str, time_data: np.ndarray, data: np.ndarray) -> None:
+        ''' Replace the data of a plotted signal without rescaling the axes, e.g. after zooming. '''
+        self._signals[key].set_data(time_data, data)
+        self.redraw()
+
+    def remove_signal(self, key: str) -> None:
+        ''' Remove a signal from the chart and return its line to the pool. '''
+        line = self._signals.pop(key, None)
+        self._decimated_ranges.pop(key, None)
+        if line is None:
+            return
+        line.set_visible(False)
+        line.set_data([], [])
+        self._line_pool.append(line)
+        self._autoscale()
+        self.redraw()
+
+    def clear(self) -> None:
+        ''' Remove all signals from the chart. '''
+        for key in list(self._signals):
+            self.remove_signal(key)
+
+    def redraw(self) -> None:
+        ''' Schedule a full draw of the figure, the background is cached again once it is done. '''
+        self._background = None
+        self.canvas.draw_idle()
+
+    def set_cursor(self, x: Optional[float]) -> None:
+        ''' Move the cursor to the time x, or hide it with None. '''
+        self.cursor_line.set_visible(x is not None)
+        if x is not None:
+            self.cursor_line.set_xdata([x, x])
+        self._blit_overlays()
+
+    def _autoscale(self) -> None:
+        ''' Fit the axes to the data of the visible signals. '''
+        lines = [line for line in self._signals.values() if len(line.get_xdata(orig=False))]
+        if not lines:
+            return
+        x_data = np.concatenate([np.asarray(line.get_xdata(orig=False), dtype=np.float64) for line in lines])
+        y_data = np.concatenate([np.asarray(line.get_ydata(orig=False), dtype=np.float64) for line in lines])
+        x_min, x_max = float(np.nanmin(x_data)), float(np.nanmax(x_data))
+        y_min, y_max = float(np.nanmin(y_data)), float(np.nanmax(y_data))
+        y_margin = (y_max - y_min) * self._Y_MARGIN or 1.0
+        self.axes.set_xlim(x_min, x_max if x_max > x_min else x_min + 1.0)
+        self.axes.set_ylim(y_min - y_margin, y_max + y_margin)
+
+    def _on_draw(self, event: Optional[DrawEvent] = None) -> None:
+        ''' Cache the freshly drawn figure, which has no overlays, and draw the overlays on top. '''
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._blit_overlays()
+
+    def _blit_overlays(self) -> None:
+        ''' Restore the cached background, draw the visible overlays onto it and blit the figure. '''
+        # Until the next full draw has cached the background, it draws the overlays itself
+        if self._background is None:
+            return
+        self.canvas.restore_region(self._background)
+        for overlay in self._overlays:
+            if overlay.get_visible():
+                self.axes.draw_artist(overlay)
+        self.canvas.blit(self.figure.bbox)
+
+    def _nearest_point(self, event: MouseEvent) -> Optional[np.ndarray]:
+        ''' Get the data point of the plotted signals nearest to the mouse position in pixels. '''
+        candidates = []
+        for line in self._signals.values():
+            x_data, y_data = line.get_xdata(orig=False), line.get_ydata(orig=False)
+            if not len(x_data):
+                continue
+            position = int(np.searchsorted(x_data, event.xdata))
+            for idx in (max(position - 1, 0), min(position, len(x_data) - 1)):
+                candidates.append((x_data[idx], y_data[idx]))
+        if not candidates:
+            return None
+        points = np.asarray(candidates, dtype=np.float64)
+        distances = np.hypot(*(self.axes.transData.transform(points) - (event.x, event.y)).T)
+        return points[int(np.nanargmin(distances))] if not np.all(np.isnan(distances)) else None
+
+    def _on_motion(self, event: MouseEvent) -> None:
+        if event.inaxes is not self.axes:
+            self._on_leave(event)
+            return
+        self.cursor_line.set_xdata([event.xdata, event.xdata])
+        self.cursor_line.set_visible(True)
+        point = self._nearest_point(event)
+        self.hover_marker.set_visible(point is not None)
+        if point is not None:
+            self.hover_marker.set_data([point[0]], [point[1]])
+        if self._selection_start is not None:
+            self.selection_rectangle.set_x(min(self._selection_start, event.xdata))
+            self.selection_rectangle.set_width(abs(event.xdata - self._selection_start))
+        self._blit_overlays()
+
+    def _on_leave(self, event: Optional[MouseEvent] = None) -> None:
+        ''' Hide the cursor and the hover marker when the mouse leaves the axes. '''
+        if self.cursor_line.get_visible() or self.hover_marker.get_visible():
+            self.cursor_line.set_visible(False)
+            self.hover_marker.set_visible(False)
+            self._blit_overlays()
+
+    def _on_press(self, event: MouseEvent) -> None:
+        ''' Start a selection of a time range with the left mouse button. '''
+        if event.inaxes is not self.axes or event.button != 1 or self.canvas.toolbar is not None and self.canvas.toolbar.mode:
+            return
+        self._selection_start = event.xdata
+        self.selection_rectangle.set_x(event.xdata)
+        self.selection_rectangle.set_width(0)
+        self.selection_rectangle.set_visible(True)
+        self._blit_overlays()
+
+    def _on_release(self, event: MouseEvent) -> None:
+        ''' Finish the selection and report the selected time range. '''
+        if self._selection_start is None:
+            return
+        selection_start, self._selection_start = self._selection_start, None
+        self.selection_rectangle.set_visible(False)
+        self._blit_overlays()
+        if event.xdata is not None and event.xdata != selection_start and self._on_select is not None:
+            self._on_select(min(selection_start, event.xdata), max(selection_start, event.xdata))
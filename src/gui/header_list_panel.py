@@ -1,8 +1,172 @@
 ''' Defines the UI and logic for the header list panel. '''
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+import math
+import sys
 import customtkinter as ctk
+from csv_data_manager import HeadersMapping
+from utils.header_search import HeaderSearchIndex
 
 
 class HeaderListPanel(ctk.CTkFrame):
-    ''' Manage the list of CSV headers. '''
-    def __init__(self, parent):
+    ''' Manage the list of CSV headers.
+    The list is virtualized: only the rows which fit into the panel have a check box widget. On scrolling and resizing
+    these widgets are recycled by changing their text and check state, so the number of widgets does not depend
+    on the number of headers and populating the list creates no widgets.
+    The search entry lists the headers matching the typed query, best matches first. '''
+    # Unscaled height of a row in pixels
+    _ROW_HEIGHT: int = 28
+
+    def __init__(self, parent, on_toggle: Optional[Callable[[int, bool], None]] = None):
         super().__init__(parent)
+
+        # Init members
+        self._on_toggle = on_toggle
+        # Index and label of every header, and of the headers currently listed, e.g. the search results
+        self._items: List[Tuple[int, str]] = []
+        self._listed_items: List[Tuple[int, str]] = []
+        self._labels: Dict[int, str] = {}
+        self._selected: Set[int] = set()
+        self._search_index: Optional[HeaderSearchIndex] = None
+        self._first_row: int = 0
+        self._row_widgets: List[ctk.CTkCheckBox] = []
+        # Slots whose row widget is placed, the row widgets of the other slots are hidden
+        self._placed_slots: Set[int] = set()
+        self._nr_of_slots: int = 0
+
+        # Configure the positioning
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_columnconfigure(1, weight=0)
+        self.grid_rowconfigure(0, weight=0)
+        self.grid_rowconfigure(1, weight=1)
+
+        # Initilize widgets
+        self.search_entry = ctk.CTkEntry(self, placeholder_text='Search')
+        self.rows_frame = ctk.CTkFrame(self, fg_color='transparent')
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+
+        # Layout widgets
+        self.search_entry.grid(row=0, column=0, columnspan=2, sticky='news')
+        self.rows_frame.grid(row=1, column=0, sticky='news')
+        self.scrollbar.grid(row=1, column=1, sticky='ns')
+
+        self.search_entry.bind('<KeyRelease>', lambda event: self.filter(self.search_entry.get()))
+
+        self.rows_frame.bind('<Configure>', self._on_resize)
+        self._bind_mousewheel(self.rows_frame)
+
+    @property
+    def selected_indices(self) -> List[int]:
+        ''' Get the indices of the checked headers. '''
+        return sorted(self._selected)
+
+    def set_headers(self, headers_mapping: HeadersMapping) -> None:
+        ''' List every header of the mapping in the order of the columns, labeled with its group and header key. '''
+        self._items = sorted((idx, f"{group}::{key}" if group is not None else str(key))
+                             for group, entries in headers_mapping.items() for key, idx in entries)
+        self._labels = dict(self._items)
+        self._selected.clear()
+        # The labels are already without prefix
+        self._search_index = HeaderSearchIndex([label for _, label in self._items], prefix=None)
+        self.filter(self.search_entry.get())
+
+    def filter(self, query: str) -> None:
+        ''' List the headers matching the query, best matches first, or every header for an empty query. '''
+        if self._search_index is None or not query.strip():
+            self.show_indices(None)
+        else:
+            self.show_indices([self._items[position][0] for position in self._search_index.search(query)])
+
+    def show_indices(self, indices: Optional[Iterable[int]]) -> None:
+        ''' List only the headers of the given indices in the given order, or every header with None. '''
+        if indices is None:
+            self._listed_items = self._items
+        else:
+            self._listed_items = [(idx, self._labels[idx]) for idx in indices if idx in self._labels]
+        self._scroll_to(0)
+
+    def set_selected(self, idx: int, selected: bool) -> None:
+        ''' Check or uncheck a header without calling on_toggle. '''
+        if selected:
+            self._selected.add(idx)
+        else:
+            self._selected.discard(idx)
+        self._refresh()
+
+    def _bind_mousewheel(self, widget) -> None:
+        if sys.platform.startswith('linux'):
+            widget.bind('<Button-4>', self._on_mousewheel)
+            widget.bind('<Button-5>', self._on_mousewheel)
+        else:
+            widget.bind('<MouseWheel>', self._on_mousewheel)
+
+    def _on_resize(self, event=None) -> None:
+        ''' Create missing row widgets for the new height, the widgets beyond it are only hidden. '''
+        self._nr_of_slots = max(1, math.ceil(self.rows_frame.winfo_height() / self._apply_widget_scaling(self._ROW_HEIGHT)))
+        while len(self._row_widgets) < self._nr_of_slots:
+            slot = len(self._row_widgets)
+            row_widget = ctk.CTkCheckBox(self.rows_frame, text='', height=self._ROW_HEIGHT,
+                                         command=lambda slot=slot: self._on_check(slot))
+            self._bind_mousewheel(row_widget)
+            self._row_widgets.append(row_widget)
+        self._scroll_to(self._first_row)
+
+    def _on_scrollbar(self, action: str, value, unit: Optional[str] = None) -> None:
+        if action == 'moveto':
+            self._scroll_to(round(float(value) * len(self._listed_items)))
+        elif action == 'scroll':
+            step = self._nr_of_slots if unit == 'pages' else 1
+            self._scroll_to(self._first_row + int(value) * step)
+
+    def _on_mousewheel(self, event) -> None:
+        if getattr(event, 'num', None) in (4, 5):
+            delta = -1 if event.num == 4 else 1
+        elif sys.platform == 'darwin':
+            delta = -event.delta
+        else:
+            delta = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        self._scroll_to(self._first_row + 3 * delta)
+
+    def _scroll_to(self, first_row: int) -> None:
+        ''' Show the listed headers from first_row on in the row widgets and update the scrollbar. '''
+        max_first_row = max(0, len(self._listed_items) - self._nr_of_slots + 1)
+        self._first_row = min(max(0, first_row), max_first_row)
+        self._refresh()
+        if self._listed_items:
+            self.scrollbar.set(self._first_row / len(self._listed_items),
+                               min(1.0, (self._first_row + self._nr_of_slots) / len(self._listed_items)))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _refresh(self) -> None:
+        ''' Rebind the row widgets to the visible headers, only changed texts and check states are configured. '''
+        for slot, row_widget in enumerate(self._row_widgets):
+            row = self._first_row + slot
+            if slot >= self._nr_of_slots or row >= len(self._listed_items):
+                if slot in self._placed_slots:
+                    row_widget.place_forget()
+                    self._placed_slots.discard(slot)
+                continue
+            idx, label = self._listed_items[row]
+            if slot not in self._placed_slots:
+                # The place geometry manager of CustomTkinter scales the position itself
+                row_widget.place(x=0, y=slot * self._ROW_HEIGHT, relwidth=1.0)
+                self._placed_slots.add(slot)
+            if row_widget.cget('text') != label:
+                row_widget.configure(text=label)
+            selected = idx in self._selected
+            if bool(row_widget.get()) != selected:
+                if selected:
+                    row_widget.select()
+                else:
+                    row_widget.deselect()
+
+    def _on_check(self, slot: int) -> None:
+        ''' Store the check state of the header shown in the slot, the widget itself shows other headers later. '''
+        row = self._first_row + slot
+        if row >= len(self._listed_items):
+            return
+        idx = self._listed_items[row][0]
+        selected = bool(self._row_widgets[slot].get())
+        self.set_selected(idx, selected)
+        if self._on_toggle is not None:
+            self._on_toggle(idx, selected)
@@ -1,9 +1,100 @@
 ''' Defines the UI and logic for the selected header panel. '''
+from tkinter import ttk
+from typing import Callable, Dict, List, Optional
+import numpy as np
 import customtkinter as ctk
 from gui.header_list_panel import HeaderListPanel
+from csv_data_manager import ColumnProfile, CSVDataManager
 
 
 class HeaderPanel(ctk.CTkFrame):
-    ''' Manage the display of the selected headers. '''
-    def __init__(self, parent):
+    ''' Manage the display of the selected headers.
+    The header list panel on top lists every header with a search entry and a check box to plot it.
+    Below, the headers are shown as a tree of their groups in headers_mapping. Only the group nodes are inserted when a file
+    is set, each with a placeholder child, the header nodes of a group are inserted when it is opened the first time.
+    The number of varying and constant signals of a group is taken from the column profile if it is already computed. '''
+    _PLACEHOLDER_SUFFIX: str = '#placeholder'
+
+    def __init__(self, parent, on_select: Optional[Callable[[List[int]], None]] = None,
+                 on_toggle: Optional[Callable[[int, bool], None]] = None):
         super().__init__(parent)
+
+        # Init members
+        self._on_select = on_select
+        # Header keys and indices of the groups whose header nodes are not inserted yet
+        self._unexpanded_groups: Dict[str, List[List]] = {}
+        self._profile: Optional[ColumnProfile] = None
+
+        # Configure the positioning
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_columnconfigure(1, weight=0)
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        # Initilize widgets
+        self.header_list_panel = HeaderListPanel(self, on_toggle=on_toggle)
+        self.tree = ttk.Treeview(self, columns=('varying', 'constant'), selectmode='extended')
+        self.tree.heading('#0', text='Signal')
+        self.tree.heading('varying', text='Varying')
+        self.tree.heading('constant', text='Constant')
+        self.tree.column('varying', width=70, stretch=False, anchor='e')
+        self.tree.column('constant', width=70, stretch=False, anchor='e')
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
+
+        # Layout widgets
+        self.header_list_panel.grid(row=0, column=0, columnspan=2, sticky='news')
+        self.tree.grid(row=1, column=0, sticky='news')
+        self.scrollbar.grid(row=1, column=1, sticky='ns')
+
+        self.tree.bind('<<TreeviewOpen>>', self._on_open)
+        self.tree.bind('<<TreeviewSelect>>', self._on_tree_select)
+
+    @property
+    def selected_indices(self) -> List[int]:
+        ''' Get the indices of the selected headers, selected groups are ignored. '''
+        return [int(iid) for iid in self.tree.selection() if iid.isdigit()]
+
+    def set_data_manager(self, csv_data_manager: Optional[CSVDataManager]) -> None:
+        ''' Show the headers and the groups of a file, or nothing with None. '''
+        self.tree.delete(*self.tree.get_children())
+        self._unexpanded_groups.clear()
+        self._profile = None
+        self.header_list_panel.set_headers(csv_data_manager.headers_mapping if csv_data_manager is not None else {})
+        if csv_data_manager is None:
+            return
+
+        profile = self._profile = csv_data_manager.column_profile if csv_data_manager.is_profiled else None
+        for group, entries in csv_data_manager.headers_mapping.items():
+            # Headers without group, e.g. the time index, are shown at the top level
+            if group is None:
+                for key, idx in entries:
+                    self.tree.insert('', 'end', iid=str(idx), text=key)
+                continue
+            if profile is not None:
+                nr_of_constant = int(np.count_nonzero(profile.is_constant[[idx for _, idx in entries]]))
+                counts = (len(entries) - nr_of_constant, nr_of_constant)
+            else:
+                counts = ('', '')
+            iid = f"group:{group}"
+            self.tree.insert('', 'end', iid=iid, text=f"{group} ({len(entries)})", values=counts)
+            self.tree.insert(iid, 'end', iid=f"{iid}{self._PLACEHOLDER_SUFFIX}")
+            self._unexpanded_groups[iid] = entries
+
+    def _on_open(self, event=None) -> None:
+        ''' Replace the placeholder of an opened group by its header nodes. '''
+        iid = self.tree.focus()
+        entries = self._unexpanded_groups.pop(iid, None)
+        if entries is None:
+            return
+        self.tree.delete(f"{iid}{self._PLACEHOLDER_SUFFIX}")
+        for key, idx in entries:
+            if self._profile is not None:
+                values = ('', '✓') if self._profile.is_constant[idx] else ('✓', '')
+            else:
+                values = ('', '')
+            self.tree.insert(iid, 'end', iid=str(idx), text=key, values=values)
+
+    def _on_tree_select(self, event=None) -> None:
+        if self._on_select is not None:
+            self._on_select(self.selected_indices)
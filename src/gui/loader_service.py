@@ -0,0 +1,94 @@
+''' Loads CSV files in a worker thread and hands the results over to the Tk mainloop. '''
+import queue
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import customtkinter as ctk
+from csv_data_manager import CSVDataManager, LoadCancelledError, ProgressCallback
+
+
+class LoaderService:
+    ''' Load CSV files in the background so the window stays responsive.
+    Progress, results and errors are posted to a queue which is polled with after() on the Tk mainloop,
+    so the callbacks are always called from the GUI thread. Starting a new load cancels the running one. '''
+    _POLL_INTERVAL_MS: int = 50
+    _CHUNKSIZE: int = 50_000
+
+    def __init__(self, widget: ctk.CTkBaseClass, on_loaded: Callable[[CSVDataManager], None],
+                 on_progress: Optional[ProgressCallback] = None, on_error: Optional[Callable[[Exception], None]] = None):
+        self._widget = widget
+        self._on_loaded = on_loaded
+        self._on_progress = on_progress
+        self._on_error = on_error
+
+        self._queue: queue.Queue = queue.Queue()
+        self._generation: int = 0
+        self._cancel_event: Optional[threading.Event] = None
+        self._worker: Optional[threading.Thread] = None
+        self._poll_id: Optional[str] = None
+
+    @property
+    def busy(self) -> bool:
+        ''' Check whether a file is being loaded. '''
+        return self._worker is not None and self._worker.is_alive()
+
+    def load(self, filepath: str, **kwargs: Any) -> None:
+        ''' Start loading a file, the keyword arguments are passed on to the CSVDataManager. '''
+        self.cancel()
+        self._generation += 1
+        self._cancel_event = threading.Event()
+        self._worker = threading.Thread(target=self._load, args=(self._generation, self._cancel_event, filepath, kwargs), daemon=True)
+        self._worker.start()
+
+        if self._poll_id is None:
+            self._poll_id = self._widget.after(self._POLL_INTERVAL_MS, self._poll)
+
+    def cancel(self) -> None:
+        ''' Cancel the running load, its results are discarded. '''
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+
+    def _load(self, generation: int, cancel_event: threading.Event, filepath: str, kwargs: Dict[str, Any]) -> None:
+        ''' Construct and profile the CSVDataManager, runs in the worker thread. '''
+        def report_progress(bytes_read: int, total_bytes: int, rows_read: int) -> None:
+            if cancel_event.is_set():
+                raise LoadCancelledError(f"Loading {filepath} was cancelled.")
+            self._queue.put((generation, 'progress', (bytes_read, total_bytes, rows_read)))
+
+        try:
+            kwargs.setdefault('chunksize', self._CHUNKSIZE)
+            csv_data_manager = CSVDataManager(filepath, progress_callback=report_progress, **kwargs)
+            # A lazy manager only loads what is requested, profiling would load every column
+            if not kwargs.get('lazy', False):
+                if cancel_event.is_set():
+                    return
+                _ = csv_data_manager.column_profile
+        except LoadCancelledError:
+            return
+        except Exception as exc:
+            self._queue.put((generation, 'error', exc))
+            return
+
+        self._queue.put((generation, 'loaded', csv_data_manager))
+
+    def _poll(self) -> None:
+        ''' Dispatch the messages of the current load on the Tk mainloop. '''
+        while True:
+            try:
+                generation, kind, payload = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            # Messages of superseded loads are dropped
+            if generation != self._generation:
+                continue
+            if kind == 'progress' and self._on_progress is not None:
+                self._on_progress(*payload)
+            elif kind == 'error' and self._on_error is not None:
+                self._on_error(payload)
+            elif kind == 'loaded':
+                self._on_loaded(payload)
+
+        if self.busy or not self._queue.empty():
+            self._poll_id = self._widget.after(self._POLL_INTERVAL_MS, self._poll)
+        else:
+            self._poll_id = None
@@ -1,9 +1,12 @@
 ''' Defines the CSVision class with the main layout. '''
+from tkinter import filedialog, messagebox
+from typing import Callable, Optional
 import customtkinter as ctk
 import sys
 from gui.header_panel import HeaderPanel
 from gui.chart_view import ChartView
-from utils.csv_data_manager import CSVDataManager
+from gui.loader_service import LoaderService
+from csv_data_manager import CSVDataManager
 
 
 class CSVision(ctk.CTk):
@@ -39,15 +42,34 @@ class CSVision(ctk.CTk):
         self.grid_rowconfigure(1, weight=1, uniform='row', minsize=50)      # Toolbar
 
         # Initilize widgets
-        self.content_frame = ctk.CTkFrame(self)
-        self.toolbar_frame = ToolbarPanel(self)
+        self.content_frame = ConentPanel(self)
+        self.toolbar_frame = ToolbarPanel(self, open_command=self.open_file)
 
         # Layout widgets
         self.content_frame.grid(row=0, column=0, sticky='news')
         self.toolbar_frame.grid(row=1, column=0, sticky='news')
 
+        # Load files in the background
+        self.csv_data_manager: Optional[CSVDataManager] = None
+        self.loader_service = LoaderService(self, on_loaded=self._on_file_loaded, on_progress=self.toolbar_frame.show_progress,
+                                            on_error=self._on_file_error)
+
+    def open_file(self, filepath: str) -> None:
+        ''' Load a CSV file without blocking the window, a file still being loaded is superseded. '''
+        self.toolbar_frame.show_progress(0, 1, 0)
+        self.loader_service.load(filepath)
+
+    def _on_file_loaded(self, csv_data_manager: CSVDataManager) -> None:
+        self.csv_data_manager = csv_data_manager
+        self.content_frame.set_data_manager(csv_data_manager)
+
+    def _on_file_error(self, exc: Exception) -> None:
+        self.toolbar_frame.show_progress(0, 1, 0)
+        messagebox.showerror(self._window_title, str(exc))
+
     def close_application(self, event=None):
         ''' Close the application. '''
+        self.loader_service.cancel()
         self.destroy()
         sys.exit(0)
 
@@ -57,25 +79,46 @@ class ConentPanel(ctk.CTkFrame):
     def __init__(self, parent, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
 
+        # Init members
+        self._csv_data_manager: Optional[CSVDataManager] = None
+
         # Configure the positioning
         self.grid_columnconfigure(0, weight=1, uniform='column')  # Searchbar and header panels
         self.grid_columnconfigure(1, weight=5, uniform='column')  # Chart view
         self.grid_rowconfigure(0, weight=1, uniform='row')
 
         # Initilize widgets
-        self.header_panel = HeaderPanel(self)
+        self.header_panel = HeaderPanel(self, on_toggle=self._on_header_toggle)
         self.chart_view = ChartView(self)
 
         # Layout widgets
         self.header_panel.grid(row=0, column=0, sticky='news')
         self.chart_view.grid(row=0, column=1, sticky='news')
 
+    def set_data_manager(self, csv_data_manager: Optional[CSVDataManager]) -> None:
+        ''' Show the headers of a loaded file and clear the chart. '''
+        self._csv_data_manager = csv_data_manager
+        self.header_panel.set_data_manager(csv_data_manager)
+        self.chart_view.set_data_manager(csv_data_manager)
+
+    def _on_header_toggle(self, idx: int, selected: bool) -> None:
+        ''' Plot a checked header and remove an unchecked one from the chart. '''
+        if self._csv_data_manager is None:
+            return
+        header = self._csv_data_manager.get_header(idx)
+        if selected:
+            self.chart_view.plot_header(header)
+        else:
+            self.chart_view.remove_signal(header)
+
 
 class ToolbarPanel(ctk.CTkFrame):
     ''' Manage the toolbar. '''
-    def __init__(self, parent, *args, **kwargs):
+    def __init__(self, parent, *args, open_command: Optional[Callable[[str], None]] = None, **kwargs):
         super().__init__(parent, *args, **kwargs)
 
+        self._open_command = open_command
+
         # Configure the positioning
         self.grid_columnconfigure(0, weight=1, uniform='column')  # Settings button
         self.grid_columnconfigure(1, weight=7, uniform='column')  # Progressbar
@@ -87,10 +130,25 @@ class ToolbarPanel(ctk.CTkFrame):
         self.settings_button = ctk.CTkButton(self)
         self.progressbar = ctk.CTkProgressBar(self)
         self.file_entry = ctk.CTkEntry(self)
-        self.file_open_button = ctk.CTkButton(self)
+        self.file_open_button = ctk.CTkButton(self, text='Open', command=self._open_file)
 
         # Layout widgets
         self.settings_button.grid(row=0, column=0, sticky='news')
         self.progressbar.grid(row=0, column=1, sticky='news')
         self.file_entry.grid(row=0, column=2, sticky='news')
         self.file_open_button.grid(row=0, column=3, sticky='news')
+
+        self.progressbar.set(0)
+
+    def _open_file(self) -> None:
+        filepath = filedialog.askopenfilename(filetypes=[('CSV files', '*.csv'), ('All files', '*.*')])
+        if not filepath:
+            return
+        self.file_entry.delete(0, 'end')
+        self.file_entry.insert(0, filepath)
+        if self._open_command is not None:
+            self._open_command(filepath)
+
+    def show_progress(self, bytes_read: int, total_bytes: int, rows_read: int) -> None:
+        ''' Show the loading progress of a CSV file in the progressbar. '''
+        self.progressbar.set(bytes_read / total_bytes if total_bytes else 1.0)
@@ -0,0 +1,140 @@
+''' Defines the HeaderSearchIndex class for the fuzzy search of CSV headers. '''
+from typing import Dict, List, Optional, Set
+import bisect
+import re
+
+
+# Tokens of a header: upper case abbreviations, capitalized or lower case words and numbers,
+# e.g. 'AmcuCommands::circFanSpeedConKP' -> 'Amcu', 'Commands', 'circ', 'Fan', 'Speed', 'Con', 'KP'
+_TOKEN_PATTERN = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+')
+# Between two characters of a term: the rest of the current token and any number of whole tokens
+_TOKEN_SKIP_PATTERN = r'(?:[^ \n]* (?:[^ \n]* )*)?'
+
+# Rank of a query term by how it matches a header, lower ranks are listed first
+_RANK_EXACT, _RANK_TOKEN_START, _RANK_SUBSTRING, _RANK_TOKEN_PREFIXES = 0, 1, 2, 3
+
+
+class HeaderSearchIndex:
+    ''' Index the headers for a case insensitive search while typing.
+    A query is split into terms at whitespace and a header matches if every term matches it, either as a substring
+    or as a sequence of token prefixes within the group or the header key, e.g. 'cfspeed' or 'circ fan' match
+    'Truma_n_AmcuCommands::circFanSpeed'. Substrings are looked up in an index of the substrings of up to three characters,
+    longer terms only check the headers containing all of their trigrams. The token prefixes are matched once per distinct
+    group and header key. A query extending the previous one is only matched against its results.
+    The results are ranked by the kind of the matches, then by the header length and index. '''
+    _MAX_NGRAM: int = 3
+
+    def __init__(self, headers: List[str], prefix: Optional[str] = 'Truma_n_'):
+        self._headers: List[str] = list(headers)
+        self._names: List[str] = []
+        self._ngrams: Dict[str, Set[int]] = {}
+        self._token_ids: Dict[str, Set[int]] = {}
+        # Whole headers without prefix and header keys after '::', matching them exactly ranks first
+        self._exact_ids: Dict[str, Set[int]] = {}
+        # Tokens of every distinct group and header key as a line, each token preceded by a space,
+        # and the headers containing them, for the token prefix matching
+        token_line_ids: Dict[str, Set[int]] = {}
+        self._token_lines: List[List[str]] = []
+
+        for idx, header in enumerate(self._headers):
+            stripped = header.replace(prefix, '', 1) if prefix and header.startswith(prefix) else header
+            name = stripped.lower()
+            self._names.append(name)
+            for length in range(1, self._MAX_NGRAM + 1):
+                for position in range(len(name) - length + 1):
+                    self._ngrams.setdefault(name[position:position + length], set()).add(idx)
+            for exact in {name, name.rsplit('::', 1)[-1]}:
+                self._exact_ids.setdefault(exact, set()).add(idx)
+            lines = []
+            for part in stripped.split('::'):
+                tokens = [token.lower() for token in _TOKEN_PATTERN.findall(part)]
+                for token in tokens:
+                    self._token_ids.setdefault(token, set()).add(idx)
+                lines.append(''.join(f" {token}" for token in tokens))
+                token_line_ids.setdefault(lines[-1], set()).add(idx)
+            self._token_lines.append(lines)
+
+        self._token_line_ids: List[Set[int]] = list(token_line_ids.values())
+        self._token_text: str = '\n'.join(token_line_ids)
+        self._line_starts: List[int] = []
+        position = 0
+        for line in token_line_ids:
+            self._line_starts.append(position)
+            position += len(line) + 1
+        # Position of every header ordered by length and index, the tie breaker of the ranking
+        self._length_order: List[int] = [0] * len(self._headers)
+        for order, idx in enumerate(sorted(range(len(self._headers)), key=lambda idx: (len(self._names[idx]), idx))):
+            self._length_order[idx] = order
+
+        # Terms and matches of the previous query for the incremental refinement
+        self._last_terms: List[str] = []
+        self._last_matches: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._headers)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[int]:
+        ''' Get the indices of the headers matching the query, best matches first.
+        An empty query matches every header in the order of the indices. '''
+        terms = query.lower().split()
+        if not terms:
+            self._last_terms, self._last_matches = [], {}
+            return list(range(len(self._headers)))[:limit]
+
+        # Terms which only grew match a subset of the previous results, e.g. 'fan' after 'fa'
+        candidates: Optional[Set[int]] = None
+        if self._last_terms and len(terms) >= len(self._last_terms) and all(
+                term.startswith(last_term) for term, last_term in zip(terms, self._last_terms)):
+            candidates = set(self._last_matches)
+
+        matches: Dict[int, int] = {}
+        for nr, term in enumerate(terms):
+            ranks = self._match_term(term, candidates)
+            matches = ranks if nr == 0 else {idx: rank + matches[idx] for idx, rank in ranks.items()}
+            candidates = set(matches)
+            if not matches:
+                break
+
+        self._last_terms, self._last_matches = terms, matches
+        nr_of_headers, length_order = len(self._headers), self._length_order
+        sort_keys = {idx: rank * nr_of_headers + length_order[idx] for idx, rank in matches.items()}
+        return sorted(sort_keys, key=sort_keys.__getitem__)[:limit]
+
+    def search_headers(self, query: str, limit: Optional[int] = None) -> List[str]:
+        ''' Get the headers matching the query, best matches first. '''
+        return [self._headers[idx] for idx in self.search(query, limit)]
+
+    def _match_term(self, term: str, candidates: Optional[Set[int]]) -> Dict[int, int]:
+        ''' Rank the headers, optionally only the candidates, which match the term. '''
+        ngrams = [term] if len(term) <= self._MAX_NGRAM else [term[position:position + self._MAX_NGRAM]
+                                                             for position in range(len(term) - self._MAX_NGRAM + 1)]
+        postings = sorted((self._ngrams.get(ngram, set()) for ngram in ngrams), key=len)
+        substring_ids = postings[0].intersection(*postings[1:])
+        if candidates is not None:
+            substring_ids &= candidates
+        if len(term) > self._MAX_NGRAM:
+            substring_ids = {idx for idx in substring_ids if term in self._names[idx]}
+
+        ranks = dict.fromkeys(substring_ids, _RANK_SUBSTRING)
+        for token, ids in self._token_ids.items():
+            if token.startswith(term):
+                ranks.update(dict.fromkeys(ids & substring_ids, _RANK_TOKEN_START))
+        ranks.update(dict.fromkeys(self._exact_ids.get(term, set()) & substring_ids, _RANK_EXACT))
+
+        if len(term) > 1 and term.isalnum():
+            for idx in self._match_token_prefixes(term, candidates):
+                ranks.setdefault(idx, _RANK_TOKEN_PREFIXES)
+
+        return ranks
+
+    def _match_token_prefixes(self, term: str, candidates: Optional[Set[int]]) -> Set[int]:
+        ''' Get the headers whose group or header key has the term as a sequence of prefixes of its tokens,
+        tokens may be skipped, e.g. 'cfs' or 'fansp' for 'circFanSpeed'. '''
+        pattern = re.compile(' ' + _TOKEN_SKIP_PATTERN.join(re.escape(character) for character in term))
+        if candidates is not None and len(candidates) * 8 < len(self._token_line_ids):
+            return {idx for idx in candidates if any(pattern.search(line) for line in self._token_lines[idx])}
+
+        ids: Set[int] = set()
+        for line_nr in {bisect.bisect_right(self._line_starts, match.start()) - 1 for match in pattern.finditer(self._token_text)}:
+            ids |= self._token_line_ids[line_nr]
+        return ids if candidates is None else ids & candidates
@@ -2,7 +2,11 @@
 import unittest
 import logging
 import inspect
+import os
+import tempfile
+from unittest import mock
 
+import numpy as np
 import pandas as pd
 
 import src.csv_data_manager as csv_d_m
@@ -16,7 +20,7 @@ class TestCSVManager(unittest.TestCase):
     var = 0
 
     def setUp(self):
-        self.csv_manager_good = csv_d_m.CSVDataManager('CSV_Files/TelemetryUI_log_2023_11_14_14_34_10_good.csv')
+        self.csv_manager_good = csv_d_m.CSVDataManager('resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv')
 
     def test_csv_data_manager(self):
         ''' Test the instance creation of the CSVDataManager class. '''
@@ -32,23 +36,758 @@ class TestCSVManager(unittest.TestCase):
         logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Raises(ValueError)')
         with self.assertRaises(ValueError):
             csv_d_m.CSVDataManager(4)
-            csv_d_m.CSVDataManager('CSV_Files/TelemetryUI_log_2023_09_28_17_37_11_xlsx.xlsx')
+            csv_d_m.CSVDataManager('resources/TelemetryUI_log_2023_09_28_17_37_11_xlsx.xlsx')
 
         testcase += 1
         logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Raises(FileNotFoundError)')
         with self.assertRaises(FileNotFoundError):
             csv_d_m.CSVDataManager('hello')
-            csv_d_m.CSVDataManager('CSV_Files/TelemetryUI_log_2023_11_14_14_34_1.csv')
+            csv_d_m.CSVDataManager('resources/TelemetryUI_log_2023_11_14_14_34_1.csv')
 
         testcase += 1
         logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Raises(pd.errors.EmptyDataError)')
         with self.assertRaises(pd.errors.EmptyDataError):
-            csv_d_m.CSVDataManager('CSV_Files/TelemetryUI_log_2023_09_28_17_37_11_empty.csv')
+            csv_d_m.CSVDataManager('resources/TelemetryUI_log_2023_09_28_17_37_11_empty.csv')
 
         testcase += 1
         logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'True')
         self.assertTrue(self.csv_manager_good.loaded)
 
+    def test_chunked_loading(self):
+        ''' Test the chunked loading mode and its progress reporting. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        progress = []
+        csv_manager_chunked = csv_d_m.CSVDataManager('resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv', chunksize=100,
+                                                     progress_callback=lambda *args: progress.append(args))
+
+        testcase, testcases = 1, 3
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(DataFrame)')
+        pd.testing.assert_frame_equal(csv_manager_chunked._dataframe, self.csv_manager_good._dataframe)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(progress)')
+        self.assertEqual(progress[-1], (progress[-1][1], progress[-1][1], len(self.csv_manager_good._dataframe)))
+        self.assertEqual([rows for _, _, rows in progress], sorted(rows for _, _, rows in progress))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Raises(pd.errors.EmptyDataError)')
+        with self.assertRaises(pd.errors.EmptyDataError):
+            csv_d_m.CSVDataManager('resources/TelemetryUI_log_2023_09_28_17_37_11_empty.csv', chunksize=100)
+
+    def test_sidecar_cache(self):
+        ''' Test the persistent columnar cache of parsed files. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            filepath = 'resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv'
+
+            testcase, testcases = 1, 3
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(cache entries)')
+            csv_d_m.CSVDataManager(filepath, cache_dir=cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            testcase += 1
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(DataFrame)')
+            csv_manager_cached = csv_d_m.CSVDataManager(filepath, cache_dir=cache_dir)
+            pd.testing.assert_frame_equal(csv_manager_cached._dataframe, self.csv_manager_good._dataframe)
+
+            testcase += 1
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(cache eviction)')
+            csv_d_m.CSVDataManager(filepath, cache_dir=cache_dir, cache_max_bytes=0)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+    def test_lazy_loading(self):
+        ''' Test the lazy mode which loads the columns on demand. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        csv_manager_lazy = csv_d_m.CSVDataManager('resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv', lazy=True)
+
+        testcase, testcases = 1, 4
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(headers)')
+        self.assertEqual(csv_manager_lazy.header_list, self.csv_manager_good.header_list)
+        self.assertEqual(csv_manager_lazy.headers_mapping, self.csv_manager_good.headers_mapping)
+        self.assertEqual(len(csv_manager_lazy._dataframe.columns), 0)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(data)')
+        self.assertEqual(csv_manager_lazy.get_data(idx=43), self.csv_manager_good.get_data(idx=43))
+        self.assertEqual(csv_manager_lazy.get_data(hdr='time index'), self.csv_manager_good.get_data(hdr='time index'))
+        self.assertEqual(len(csv_manager_lazy._dataframe.columns), 2)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(load_columns)')
+        csv_manager_lazy.load_columns(idx_list=[1, 2, 43], hdr_list=['Truma_n_AmcuData::atsTemp'])
+        self.assertEqual(len(csv_manager_lazy._dataframe.columns), 5)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(const data)')
+        self.assertFalse(csv_manager_lazy.is_profiled)
+        self.assertEqual(csv_manager_lazy.const_data_index_list, self.csv_manager_good.const_data_index_list)
+        self.assertTrue(csv_manager_lazy.is_profiled)
+
+    def test_time_data(self):
+        ''' Test the conversion of the time index to seconds. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        testcase, testcases = 1, 5
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(time data)')
+        time_data = self.csv_manager_good.time_data_list
+        self.assertEqual(len(time_data), len(self.csv_manager_good.get_data(hdr='time index')))
+        self.assertEqual(time_data[:3], [0.0, 0.492, 0.993])
+        self.assertEqual(time_data[-1], 1085.756)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Is(cached time data)')
+        self.assertIs(self.csv_manager_good.time_data_array, self.csv_manager_good.time_data_array)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Raises(ValueError)')
+        with self.assertRaises(ValueError):
+            self.csv_manager_good.time_data_array[0] = 1.0
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(date-time strings)')
+        date_time = pd.Series(['2023-11-14 14:34:10.444', '2023-11-14 14:34:11.000', '2023-11-14 14:35:11.250'])
+        milliseconds = csv_d_m.CSVDataManager._time_in_milliseconds(date_time)
+        self.assertEqual((milliseconds - milliseconds[0]).tolist(), [0, 556, 60806])
+        self.assertEqual(milliseconds[0] / 1e3, pd.Timestamp('2023-11-14 14:34:10.444').timestamp())
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(time data across midnight)')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = os.path.join(tmp_dir, 'TelemetryUI_log.csv')
+            midnight = pd.Timestamp('2023-11-14 23:59:50').timestamp()
+            with open(filepath, 'w', encoding='utf-8') as file:
+                file.write('time index;a\n' + ''.join(f"{midnight + row:.3f};{row}\n" for row in range(20)))
+            csv_manager_midnight = csv_d_m.CSVDataManager(filepath)
+            self.assertEqual(csv_manager_midnight.time_data_list, [float(row) for row in range(20)])
+            self.assertEqual(csv_manager_midnight.get_data_extrema(hdr='a', t_start=5, t_end=15),
+                             csv_manager_midnight._pad_extrema(5.0, 15.0))
+
+    def test_get_array(self):
+        ''' Test the zero-copy array access of the data. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        testcase, testcases = 1, 3
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(data)')
+        data = self.csv_manager_good.get_array(idx=43)
+        self.assertEqual(data.tolist(), self.csv_manager_good.get_data(idx=43))
+        self.assertEqual(data.dtype, np.int64)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'True(shares memory)')
+        self.assertTrue(np.shares_memory(data, self.csv_manager_good.get_array(hdr=self.csv_manager_good.get_header(43))))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Raises(ValueError)')
+        with self.assertRaises(ValueError):
+            data[0] = 1
+
+    def test_column_profile(self):
+        ''' Test the column profile and the properties answered from it. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        dataframe = self.csv_manager_good._dataframe
+
+        testcase, testcases = 1, 5
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(const data)')
+        const_data = [idx for idx, column in enumerate(dataframe.columns) if (dataframe[column] == dataframe[column].iloc[0]).all()]
+        self.assertEqual(self.csv_manager_good.const_data_index_list, const_data)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(const zero data)')
+        const_zero_data = [idx for idx, column in enumerate(dataframe.columns) if (dataframe[column] == 0).all()]
+        self.assertEqual(self.csv_manager_good.const_zero_data_index_list, const_zero_data)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(varying data)')
+        self.assertEqual(self.csv_manager_good.varying_data_index_list, sorted(set(self.csv_manager_good.index_list) - set(const_data)))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(data extrema)')
+        self.assertEqual(self.csv_manager_good.get_data_extrema(43), (-15879.55, 333514.55))
+        self.assertEqual(self.csv_manager_good.get_data_extrema(hdr='Truma_n_AmcuCommands::ehcuCtrlRelay1'), (-1.0, 1.0))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(profile)')
+        profile = self.csv_manager_good.column_profile
+        self.assertIs(profile, self.csv_manager_good.column_profile)
+        self.assertEqual(profile.minimum[43], dataframe.iloc[:, 43].min())
+        self.assertEqual(profile.maximum[43], dataframe.iloc[:, 43].max())
+        self.assertEqual(profile.nan_count.sum(), 0)
+        self.assertEqual(profile.nunique_estimate[0], len(dataframe))
+
+    def test_decimated_data(self):
+        ''' Test the reduction of a signal to the pixel width of a chart. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        data = self.csv_manager_good.get_array(idx=43)
+        time_data = self.csv_manager_good.time_data_array
+
+        testcase, testcases = 1, 5
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(minmax)')
+        decimated_time, decimated_data = self.csv_manager_good.get_decimated_data(idx=43, width=100)
+        self.assertLessEqual(len(decimated_data), 200)
+        self.assertEqual((decimated_data.min(), decimated_data.max()), (data.min(), data.max()))
+        self.assertTrue((np.diff(decimated_time) >= 0).all())
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(lttb)')
+        decimated_time, decimated_data = self.csv_manager_good.get_decimated_data(idx=43, width=100, method='lttb')
+        self.assertEqual(len(decimated_data), 200)
+        self.assertEqual((decimated_time[0], decimated_time[-1]), (time_data[0], time_data[-1]))
+        self.assertTrue((np.diff(decimated_time) > 0).all())
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(time window)')
+        decimated_time, decimated_data = self.csv_manager_good.get_decimated_data(idx=43, t_start=100.0, t_end=110.0)
+        window = (time_data >= 100.0) & (time_data <= 110.0)
+        self.assertEqual(decimated_time.tolist(), time_data[window].tolist())
+        self.assertEqual(decimated_data.tolist(), data[window].tolist())
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(empty time window)')
+        self.assertEqual(len(self.csv_manager_good.get_decimated_data(idx=43, t_start=2000.0)[1]), 0)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Raises(ValueError)')
+        with self.assertRaises(ValueError):
+            self.csv_manager_good.get_decimated_data(idx=43, method='mean')
+        with self.assertRaises(ValueError):
+            self.csv_manager_good.get_decimated_data(idx=43, width=0)
+
+    def test_pyramid(self):
+        ''' Test the min/max pyramid of a signal and its sidecar file. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        data = self.csv_manager_good.get_array(idx=43)
+
+        testcase, testcases = 1, 4
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(pyramid levels)')
+        pyramid = csv_d_m.MinMaxPyramid.from_array(data)
+        self.assertEqual(len(pyramid.minima[3]), -(-len(data) // 8))
+        self.assertEqual(pyramid.minima[3][5], data[40:48].min())
+        self.assertEqual(pyramid.maxima[3][5], data[40:48].max())
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(pyramid decimation)')
+        decimated_time, decimated_data = self.csv_manager_good.get_decimated_data(idx=43, width=100, method='pyramid')
+        self.assertLessEqual(len(decimated_data), 2 * 100 + 2)
+        self.assertEqual((decimated_data.min(), decimated_data.max()), (data.min(), data.max()))
+        self.assertTrue((np.diff(decimated_time) >= 0).all())
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(peak in the last rows)')
+        peak_data = np.zeros(2003)
+        peak_data[-2] = 999.0
+        peak_pyramid = csv_d_m.MinMaxPyramid.from_array(peak_data)
+        self.assertEqual([len(level) for level in peak_pyramid.maxima[:4]], [2003, 1002, 501, 251])
+        rows, _, maxima = peak_pyramid.decimate(0, len(peak_data), 10)
+        self.assertEqual((rows[-1], maxima.max()), (1792, 999.0))
+        self.assertEqual(peak_pyramid.range_extrema(1990, 2003), (0.0, 999.0))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(pyramid sidecar)')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = self.csv_manager_good.save_pyramids(os.path.join(tmp_dir, 'pyramids.npz'))
+            csv_manager = csv_d_m.CSVDataManager('resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv')
+            self.assertTrue(csv_manager.load_pyramids(filepath))
+            self.assertEqual(csv_manager._memory_cache.get(('pyramid', 43)).maxima[3].tolist(), pyramid.maxima[3].tolist())
+            self.assertFalse(csv_manager.load_pyramids(os.path.join(tmp_dir, 'missing.npz')))
+
+            for idx in (3, 5, 43):
+                self.csv_manager_good.get_decimated_data(idx=idx, method='pyramid')
+            filepath = self.csv_manager_good.save_pyramids(os.path.join(tmp_dir, 'pyramids.npz'))
+            csv_manager_lazy = csv_d_m.CSVDataManager('resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv', lazy=True)
+            with mock.patch.object(csv_d_m.pd, 'read_csv', wraps=pd.read_csv) as read_csv:
+                self.assertTrue(csv_manager_lazy.load_pyramids(filepath))
+            self.assertEqual(read_csv.call_count, 1)
+            self.assertEqual(csv_manager_lazy._memory_cache.get(('pyramid', 5)).maxima[2].tolist(),
+                             self.csv_manager_good._memory_cache.get(('pyramid', 5)).maxima[2].tolist())
+
+    def test_data_extrema_time_window(self):
+        ''' Test the extrema of the data within a time window. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        data = self.csv_manager_good.get_array(idx=43)
+        time_data = self.csv_manager_good.time_data_array
+
+        testcase, testcases = 1, 3
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(range extrema)')
+        pyramid = csv_d_m.MinMaxPyramid.from_array(data)
+        for start, stop in [(0, len(data)), (1, 2), (7, 1000), (33, 34), (1023, 2035)]:
+            self.assertEqual(pyramid.range_extrema(start, stop), (data[start:stop].min(), data[start:stop].max()))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(data extrema)')
+        self.assertEqual(self.csv_manager_good.get_data_extrema(idx=43, t_start=0.0), self.csv_manager_good.get_data_extrema(idx=43))
+        window = data[(time_data >= 100.0) & (time_data <= 300.0)]
+        buffer = abs(0.05 * (window.max() - window.min()))
+        self.assertEqual(self.csv_manager_good.get_data_extrema(hdr=self.csv_manager_good.get_header(43), t_start=100.0, t_end=300.0),
+                         (round(window.min() - buffer, 3), round(window.max() + buffer, 3)))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Raises(ValueError)')
+        with self.assertRaises(ValueError):
+            self.csv_manager_good.get_data_extrema(idx=43, t_start=2000.0)
+
+    def test_load_cancelled(self):
+        ''' Test aborting the loading of a file from the progress callback. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        def cancel(*_):
+            raise csv_d_m.LoadCancelledError('cancelled')
+
+        testcase, testcases = 1, 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Raises(LoadCancelledError)')
+        with self.assertRaises(csv_d_m.LoadCancelledError):
+            csv_d_m.CSVDataManager('resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv', chunksize=100, progress_callback=cancel)
+
+    def test_follow_mode(self):
+        ''' Test refreshing a file which is still being written. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        with open('resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv', 'rb') as file:
+            content = file.read()
+        split_position = content.index(b'\n', len(content) // 2) + 20
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = os.path.join(tmp_dir, 'TelemetryUI_log.csv')
+            with open(filepath, 'wb') as file:
+                file.write(content[:split_position])
+            csv_manager_follow = csv_d_m.CSVDataManager(filepath, follow=True)
+            nr_of_rows = len(csv_manager_follow.time_data_list)
+            _ = csv_manager_follow.const_data_index_list
+
+            testcase, testcases = 1, 5
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(refresh without complete line)')
+            self.assertEqual(nr_of_rows, content[:split_position].count(b'\n') - 1)
+            self.assertEqual(csv_manager_follow.refresh(), 0)
+
+            testcase += 1
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(appended rows)')
+            with open(filepath, 'ab') as file:
+                file.write(content[split_position:])
+            self.assertEqual(csv_manager_follow.refresh(), len(self.csv_manager_good.time_data_list) - nr_of_rows)
+            pd.testing.assert_frame_equal(csv_manager_follow._dataframe, self.csv_manager_good._dataframe)
+
+            testcase += 1
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(time data and profile)')
+            self.assertEqual(csv_manager_follow.time_data_list, self.csv_manager_good.time_data_list)
+            self.assertEqual(csv_manager_follow.const_data_index_list, self.csv_manager_good.const_data_index_list)
+            self.assertEqual(csv_manager_follow.const_zero_data_index_list, self.csv_manager_good.const_zero_data_index_list)
+            self.assertEqual(csv_manager_follow.get_data_extrema(idx=43), self.csv_manager_good.get_data_extrema(idx=43))
+
+            testcase += 1
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(follow from the header line only)')
+            header_position = content.index(b'\n') + 1
+            with open(filepath, 'wb') as file:
+                file.write(content[:header_position])
+            csv_manager_follow = csv_d_m.CSVDataManager(filepath, follow=True)
+            self.assertEqual(csv_manager_follow.time_data_list, [])
+            _ = csv_manager_follow.const_data_index_list
+            with open(filepath, 'ab') as file:
+                file.write(content[header_position:])
+            self.assertEqual(csv_manager_follow.refresh(), len(self.csv_manager_good.time_data_list))
+            pd.testing.assert_frame_equal(csv_manager_follow._dataframe, self.csv_manager_good._dataframe)
+            self.assertEqual(csv_manager_follow.time_data_list, self.csv_manager_good.time_data_list)
+            self.assertEqual(csv_manager_follow.const_data_index_list, self.csv_manager_good.const_data_index_list)
+            self.assertEqual(csv_manager_follow.get_data_extrema(idx=43), self.csv_manager_good.get_data_extrema(idx=43))
+
+            testcase += 1
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Raises(ValueError)')
+            with self.assertRaises(ValueError):
+                self.csv_manager_good.refresh()
+            with self.assertRaises(ValueError):
+                csv_d_m.CSVDataManager(filepath, lazy=True, follow=True)
+
+    def test_session(self):
+        ''' Test a session of several files of one run. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        with open('resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv', 'rb') as file:
+            header = file.readline()
+            content = file.read()
+        split_position = content.index(b'\n', len(content) // 3) + 1
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepaths = [os.path.join(tmp_dir, f"TelemetryUI_log_{nr}.csv") for nr in range(3)]
+            # The files are passed in the wrong order
+            for filepath, part in zip(filepaths, [content[split_position:], content[:split_position]]):
+                with open(filepath, 'wb') as file:
+                    file.write(header + part)
+            progress = []
+            session = csv_d_m.CSVSession(filepaths[:2], processes=2, progress_callback=lambda *args: progress.append(args))
+
+            testcase, testcases = 1, 5
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(headers)')
+            self.assertEqual(session.header_list, self.csv_manager_good.header_list)
+            self.assertEqual(session.get_index('Truma_n_AmcuDebugData::operationTime'), 43)
+
+            testcase += 1
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(data)')
+            self.assertEqual(session.time_data_list, self.csv_manager_good.time_data_list)
+            self.assertEqual(session.get_data(idx=43), self.csv_manager_good.get_data(idx=43))
+
+            testcase += 1
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(data extrema)')
+            self.assertEqual(session.get_data_extrema(idx=43), self.csv_manager_good.get_data_extrema(idx=43))
+
+            testcase += 1
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(progress per loaded file)')
+            total_bytes = sum(os.path.getsize(filepath) for filepath in filepaths[:2])
+            self.assertEqual(len(progress), 2)
+            self.assertEqual(progress[-1], (total_bytes, total_bytes, len(self.csv_manager_good.time_data_list)))
+
+            testcase += 1
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Raises(ValueError)')
+            with open(filepaths[2], 'wb') as file:
+                file.write(b'time index;other\n1699969936.390;0\n')
+            with self.assertRaises(ValueError):
+                csv_d_m.CSVSession(filepaths, processes=1)
+
+    def test_row_index(self):
+        ''' Test the row offset index and reading a time window with it. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        time_data = self.csv_manager_good.time_data_array
+        dataframe = self.csv_manager_good._dataframe
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = os.path.join(tmp_dir, 'TelemetryUI_log.csv')
+            with open('resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv', 'rb') as source, open(filepath, 'wb') as file:
+                file.write(source.read())
+            csv_manager = csv_d_m.CSVDataManager(filepath, lazy=True)
+
+            testcase, testcases = 1, 5
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(row index)')
+            row_index = csv_manager.build_row_index(every=100)
+            self.assertEqual(len(row_index.offsets), -(-len(dataframe) // 100))
+            self.assertEqual(row_index.timestamps[1], dataframe['time index'][100])
+            self.assertTrue(os.path.isfile(filepath + '.rows.npz'))
+
+            testcase += 1
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(time window)')
+            window = csv_manager.read_time_window(100.0, 300.0)
+            expected = dataframe[(time_data >= 100.0) & (time_data <= 300.0)].reset_index(drop=True)
+            pd.testing.assert_frame_equal(window, expected)
+            self.assertEqual(len(csv_manager._dataframe.columns), 0)
+
+            testcase += 1
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(time window columns)')
+            window = csv_manager.read_time_window(t_end=10.0, hdr_list=[csv_manager.get_header(43)])
+            self.assertEqual(window.iloc[:, 0].tolist(), dataframe.iloc[:, 43][time_data <= 10.0].tolist())
+
+            testcase += 1
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(sidecar validation)')
+            self.assertIsNotNone(csv_d_m.RowOffsetIndex.load(filepath + '.rows.npz', filepath))
+            with open(filepath, 'ab') as file:
+                file.write(b'\n')
+            self.assertIsNone(csv_d_m.RowOffsetIndex.load(filepath + '.rows.npz', filepath))
+
+            testcase += 1
+            logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(leading blank lines)')
+            blank_filepath = os.path.join(tmp_dir, 'TelemetryUI_log_blank.csv')
+            with open('resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv', 'rb') as source, open(blank_filepath, 'wb') as file:
+                file.write(b'\r\n\r\n' + source.read())
+            csv_manager = csv_d_m.CSVDataManager(blank_filepath, lazy=True)
+            window = csv_manager.read_time_window(10.0, 12.0)
+            expected = dataframe[(time_data >= 10.0) & (time_data <= 12.0)].reset_index(drop=True)
+            self.assertGreater(len(expected), 0)
+            pd.testing.assert_frame_equal(window, expected)
+            row_index = csv_d_m.RowOffsetIndex.build(blank_filepath, every=1)
+            self.assertEqual(row_index.timestamps.tolist(), dataframe['time index'].tolist())
+
+    def test_scan_headers(self):
+        ''' Test reading the headers from the first line only. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        filepath = 'resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv'
+
+        testcase, testcases = 1, 5
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(headers)')
+        headers, headers_mapping = csv_d_m.scan_headers(filepath)
+        self.assertEqual(headers, self.csv_manager_good.header_list)
+        self.assertEqual(headers_mapping, self.csv_manager_good.headers_mapping)
+        self.assertIn(['operationTime', 43], headers_mapping['AmcuDebugData'])
+        self.assertEqual(headers_mapping[None], [['time index', 0]])
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Is(cached)')
+        self.assertIs(csv_d_m.scan_headers(filepath)[1], headers_mapping)
+        self.assertIs(self.csv_manager_good.headers_mapping, self.csv_manager_good.headers_mapping)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(duplicated headers)')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            duplicated_filepath = os.path.join(tmp_dir, 'TelemetryUI_log.csv')
+            with open(duplicated_filepath, 'w', encoding='utf-8') as file:
+                file.write('time index;a::b;a::b;|x;y|\n1;2;3;4\n')
+            self.assertEqual(csv_d_m.scan_headers(duplicated_filepath)[0], pd.read_csv(duplicated_filepath, delimiter=';', quotechar='|').columns.tolist())
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(byte order mark and empty headers)')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            bom_filepath = os.path.join(tmp_dir, 'TelemetryUI_log.csv')
+            with open(bom_filepath, 'w', encoding='utf-8-sig') as file:
+                file.write('time index;a;;b;\n1.0;2;3;4;5\n2.0;6;7;8;9\n')
+            headers = csv_d_m.scan_headers(bom_filepath)[0]
+            self.assertEqual(headers, pd.read_csv(bom_filepath, delimiter=';', quotechar='|').columns.tolist())
+            self.assertEqual(headers, ['time index', 'a', 'Unnamed: 2', 'b', 'Unnamed: 4'])
+            csv_manager_lazy = csv_d_m.CSVDataManager(bom_filepath, lazy=True)
+            self.assertEqual(csv_manager_lazy.time_data_list, [0.0, 1.0])
+            self.assertEqual(csv_manager_lazy.get_data(hdr='Unnamed: 4'), [5.0, 9.0])
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Raises(pd.errors.EmptyDataError)')
+        with self.assertRaises(pd.errors.EmptyDataError):
+            csv_d_m.scan_headers('resources/TelemetryUI_log_2023_09_28_17_37_11_empty.csv')
+
+    def test_parallel_loading(self):
+        ''' Test parsing byte ranges of a file in worker processes. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        testcase, testcases = 1, 3
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(DataFrame)')
+        csv_manager_parallel = csv_d_m.CSVDataManager('resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv', workers=3)
+        pd.testing.assert_frame_equal(csv_manager_parallel._dataframe, self.csv_manager_good._dataframe)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(promoted columns and blank lines)')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = os.path.join(tmp_dir, 'TelemetryUI_log.csv')
+            with open(filepath, 'w', encoding='utf-8') as file:
+                file.write('time index;a;b\n1.0;1;2\n\n2.0;3;4\n3.0;5.5;6\n4.0;7;\n5.0;9;10\n')
+            csv_manager_parallel = csv_d_m.CSVDataManager(filepath, workers=4)
+            pd.testing.assert_frame_equal(csv_manager_parallel._dataframe, pd.read_csv(filepath, delimiter=';'))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(serial fallback for strings after the sample)')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = os.path.join(tmp_dir, 'TelemetryUI_log.csv')
+            with open(filepath, 'w', encoding='utf-8') as file:
+                file.write('time index;a\n' + ''.join(f"{row}.0;{'abc' if row == 3000 else row}\n" for row in range(4000)))
+            csv_manager_parallel = csv_d_m.CSVDataManager(filepath, workers=2)
+            pd.testing.assert_frame_equal(csv_manager_parallel._dataframe, pd.read_csv(filepath, delimiter=';'))
+
+    def test_optimize_dtypes(self):
+        ''' Test downcasting the columns to the narrowest types. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        filepath = 'resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv'
+        csv_manager_optimized = csv_d_m.CSVDataManager(filepath, optimize_dtypes=True)
+        memory_usage = self.csv_manager_good._dataframe.memory_usage(index=False).sum()
+
+        testcase, testcases = 1, 5
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(data and data extrema)')
+        for idx in csv_manager_optimized.index_list:
+            self.assertEqual(csv_manager_optimized.get_data(idx=idx), self.csv_manager_good.get_data(idx=idx))
+            self.assertEqual(csv_manager_optimized.get_data_extrema(idx=idx), self.csv_manager_good.get_data_extrema(idx=idx))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Greater(memory reduction)')
+        self.assertGreater(memory_usage / csv_manager_optimized._dataframe.memory_usage(index=False).sum(), 4)
+        self.assertEqual(csv_manager_optimized.get_array(hdr='Truma_n_AmcuCommands::ehcuCtrlRelay1').dtype, np.uint8)
+        self.assertEqual(csv_manager_optimized.get_array(hdr='time index').dtype, np.float64)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(schema of previous file)')
+        csv_manager_chunked = csv_d_m.CSVDataManager(filepath, optimize_dtypes=True, chunksize=500)
+        pd.testing.assert_frame_equal(csv_manager_chunked._dataframe, csv_manager_optimized._dataframe)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(DataFrame from cache)')
+        with tempfile.TemporaryDirectory() as cache_dir:
+            csv_d_m.CSVDataManager(filepath, optimize_dtypes=True, cache_dir=cache_dir)
+            csv_manager_cached = csv_d_m.CSVDataManager(filepath, optimize_dtypes=True, cache_dir=cache_dir)
+            pd.testing.assert_frame_equal(csv_manager_cached._dataframe, csv_manager_optimized._dataframe)
+            csv_manager_cached = csv_d_m.CSVDataManager(filepath, cache_dir=cache_dir)
+            pd.testing.assert_frame_equal(csv_manager_cached._dataframe, self.csv_manager_good._dataframe)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(narrowest int dtype)')
+        self.assertEqual(csv_d_m._narrowest_int_dtype(0, 1), np.uint8)
+        self.assertEqual(csv_d_m._narrowest_int_dtype(-1, 200), np.int16)
+        self.assertEqual(csv_d_m._narrowest_int_dtype(0, 70000), np.uint32)
+
+    def test_run_length_columns(self):
+        ''' Test the run-length encoded storage of constant and rarely changing columns. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        filepath = 'resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv'
+        csv_manager_rle = csv_d_m.CSVDataManager(filepath, run_length_ratio=0.01)
+        time_data = self.csv_manager_good.time_data_array
+
+        testcase, testcases = 1, 5
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(data and data extrema)')
+        self.assertGreater(len(csv_manager_rle._rle_columns), 0)
+        for idx in csv_manager_rle.index_list:
+            self.assertEqual(csv_manager_rle.get_data(idx=idx), self.csv_manager_good.get_data(idx=idx))
+            self.assertEqual(csv_manager_rle.get_data_extrema(idx=idx, t_start=time_data[100], t_end=time_data[500]),
+                             self.csv_manager_good.get_data_extrema(idx=idx, t_start=time_data[100], t_end=time_data[500]))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(constant data index lists)')
+        self.assertEqual(csv_manager_rle.const_data_index_list, self.csv_manager_good.const_data_index_list)
+        self.assertEqual(csv_manager_rle.varying_data_index_list, self.csv_manager_good.varying_data_index_list)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(run-length column slices)')
+        column = csv_d_m.RunLengthColumn.from_array(np.array([1, 1, 2, 2, 2, 3, 1]))
+        self.assertEqual(column.to_array().tolist(), [1, 1, 2, 2, 2, 3, 1])
+        self.assertEqual(column.to_array(1, 4).tolist(), [1, 2, 2])
+        self.assertEqual(column.range_extrema(3, 6), (2.0, 3.0))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(transitions)')
+        data = self.csv_manager_good.get_array(idx=3)
+        changes = np.flatnonzero(np.diff(data)) + 1
+        times, values = csv_manager_rle.get_transitions(idx=3)
+        np.testing.assert_array_equal(times, time_data[np.concatenate(([0], changes))])
+        np.testing.assert_array_equal(values, data[np.concatenate(([0], changes))])
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Raises(ValueError)')
+        with self.assertRaises(ValueError):
+            csv_d_m.CSVDataManager(filepath, lazy=True, run_length_ratio=0.01)
+
+    def test_get_arrays(self):
+        ''' Test fetching several signals at once as a 2D array. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        group = self.csv_manager_good.headers_mapping['AmcuCommands']
+        headers = [self.csv_manager_good.get_header(idx) for _, idx in group]
+        time_data = self.csv_manager_good.time_data_array
+
+        testcase, testcases = 1, 4
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(group data)')
+        times, data = self.csv_manager_good.get_arrays(hdr_list=headers)
+        np.testing.assert_array_equal(times, time_data)
+        self.assertEqual(data.shape, (len(headers), len(time_data)))
+        self.assertTrue(data.flags.c_contiguous)
+        for row, header in enumerate(headers):
+            self.assertEqual(data[row].tolist(), self.csv_manager_good.get_data(hdr=header))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(indices before headers)')
+        _, data = self.csv_manager_good.get_arrays(idx_list=[43], hdr_list=headers[:1])
+        self.assertEqual(data[0].tolist(), self.csv_manager_good.get_data(idx=43))
+        self.assertEqual(data[1].tolist(), self.csv_manager_good.get_data(hdr=headers[0]))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(time window of run-length columns)')
+        csv_manager_rle = csv_d_m.CSVDataManager('resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv', run_length_ratio=0.01)
+        times, data = csv_manager_rle.get_arrays(idx_list=self.csv_manager_good.index_list, t_start=time_data[100], t_end=time_data[500])
+        np.testing.assert_array_equal(times, time_data[100:501])
+        _, expected = self.csv_manager_good.get_arrays(idx_list=self.csv_manager_good.index_list)
+        np.testing.assert_array_equal(data, expected[:, 100:501])
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Raises(IndexError, ValueError)')
+        with self.assertRaises(IndexError):
+            self.csv_manager_good.get_arrays(idx_list=[43, 1000])
+        with self.assertRaises(ValueError):
+            self.csv_manager_good.get_arrays(hdr_list=headers + ['Truma_n_Unknown::signal'])
+        with self.assertRaises(ValueError):
+            self.csv_manager_good.get_arrays()
+
+    def test_schema(self):
+        ''' Test the immutable schema used for the header lookups. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        schema = self.csv_manager_good.schema
+
+        testcase, testcases = 1, 4
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(headers and indices)')
+        self.assertEqual(list(schema.headers), self.csv_manager_good.header_list)
+        self.assertEqual(len(schema), 301)
+        self.assertEqual(schema.index_of('Truma_n_AmcuDebugData::operationTime'), 43)
+        self.assertIn('time index', schema)
+        self.assertIs(self.csv_manager_good.headers_mapping, schema.headers_mapping)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(dtypes)')
+        self.assertEqual(schema.dtypes['time index'], np.float64)
+        csv_manager_optimized = csv_d_m.CSVDataManager('resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv', optimize_dtypes=True)
+        self.assertEqual(csv_manager_optimized.schema.dtypes['Truma_n_AmcuCommands::ehcuCtrlRelay1'], np.uint8)
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(lazy schema)')
+        csv_manager_lazy = csv_d_m.CSVDataManager('resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv', lazy=True)
+        self.assertEqual(csv_manager_lazy.schema.headers, schema.headers)
+        self.assertEqual(csv_manager_lazy.schema.dtypes, {})
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Raises(AttributeError, ValueError)')
+        with self.assertRaises(AttributeError):
+            schema.headers = ()
+        with self.assertRaises(ValueError):
+            schema.index_of('Truma_n_Unknown::signal')
+        with self.assertRaises(ValueError):
+            self.csv_manager_good.get_index('Truma_n_Unknown::signal')
+
+    def test_memory_cache(self):
+        ''' Test the memory-budgeted cache of converted columns and derived products. '''
+        TestCSVManager.var += 1
+        logging.info('TEST %s: %s', TestCSVManager.var, inspect.currentframe().f_code.co_name)
+
+        cache = self.csv_manager_good.memory_cache
+
+        testcase, testcases = 1, 4
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(hits and misses)')
+        data = self.csv_manager_good.get_data(idx=43)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        self.assertEqual(self.csv_manager_good.get_data(hdr='Truma_n_AmcuDebugData::operationTime'), data)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(cached copies)')
+        data.clear()
+        self.assertEqual(len(self.csv_manager_good.get_data(idx=43)), 2036)
+        decimated = self.csv_manager_good.get_decimated_data(idx=43, width=100)
+        self.assertIs(self.csv_manager_good.get_decimated_data(idx=43, width=100), decimated)
+        with self.assertRaises(ValueError):
+            decimated[1][0] = 0.0
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'LessEqual(memory budget)')
+        csv_manager = csv_d_m.CSVDataManager('resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv', memory_cache_max_bytes=200_000)
+        for idx in csv_manager.index_list:
+            self.assertEqual(csv_manager.get_data(idx=idx), self.csv_manager_good.get_data(idx=idx))
+        self.assertLessEqual(csv_manager.memory_cache.nbytes, 200_000)
+        self.assertEqual(len(csv_manager.memory_cache), 200_000 // (2036 * 32))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(least recently used eviction)')
+        cache = csv_d_m.MemoryCache(max_bytes=10)
+        cache.put('a', 1, 4)
+        cache.put('b', 2, 4)
+        cache.get('a')
+        cache.put('c', 3, 4)
+        self.assertEqual(('a' in cache, 'b' in cache, 'c' in cache), (True, False, True))
+        cache.put('d', 4, 11)
+        self.assertNotIn('d', cache)
+
 
 if __name__ == '__main__':
     unittest.main()
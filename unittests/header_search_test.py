@@ -0,0 +1,88 @@
+""" This module contains the TestHeaderSearch class which tests the HeaderSearchIndex class. """
+import unittest
+import logging
+import inspect
+
+import src.csv_data_manager as csv_d_m
+import src.utils.header_search as header_search
+
+
+class TestHeaderSearch(unittest.TestCase):
+    ''' Module for testing the HeaderSearchIndex class. '''
+    logging.basicConfig(format='%(levelname)s\t%(asctime)s\t%(message)s', level=logging.DEBUG, datefmt='%I:%M:%S')
+
+    logging.info('TESTCLASS: %s', inspect.currentframe().f_code.co_name)
+    var = 0
+
+    def setUp(self):
+        self.headers = csv_d_m.scan_headers('resources/TelemetryUI_log_2023_11_14_14_34_10_good.csv')[0]
+        self.search_index = header_search.HeaderSearchIndex(self.headers)
+
+    def test_substring_search(self):
+        ''' Test the case insensitive substring search and its ranking. '''
+        TestHeaderSearch.var += 1
+        logging.info('TEST %s: %s', TestHeaderSearch.var, inspect.currentframe().f_code.co_name)
+
+        testcase, testcases = 1, 4
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(exact header key first)')
+        self.assertEqual(self.search_index.search_headers('OperationTime'), ['Truma_n_AmcuDebugData::operationTime'])
+        self.assertEqual(self.search_index.search_headers('relay1')[0], 'Truma_n_AmcuCommands::ehcuCtrlRelay1')
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(every match)')
+        for query in ['fan', 'amcucommands::', 'kp', 'e']:
+            expected = {idx for idx, header in enumerate(self.headers) if query in header.replace('Truma_n_', '').lower()}
+            self.assertTrue(expected <= set(self.search_index.search(query)))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(all terms)')
+        for header in self.search_index.search_headers('circ fan'):
+            self.assertIn('circ', header.lower())
+            self.assertIn('fan', header.lower())
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(no match, empty query and limit)')
+        self.assertEqual(self.search_index.search('zzz'), [])
+        self.assertEqual(self.search_index.search(''), list(range(len(self.headers))))
+        self.assertEqual(len(self.search_index.search('fan', limit=3)), 3)
+
+    def test_token_prefix_search(self):
+        ''' Test the matching of sequences of camelCase token prefixes. '''
+        TestHeaderSearch.var += 1
+        logging.info('TEST %s: %s', TestHeaderSearch.var, inspect.currentframe().f_code.co_name)
+
+        testcase, testcases = 1, 3
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'In(token prefixes)')
+        self.assertIn('Truma_n_AmcuCommands::circFanSpeed', self.search_index.search_headers('cfs'))
+        self.assertIn('Truma_n_AmcuCommands::circFanSpeedConKP', self.search_index.search_headers('fanspconkp'))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Less(substring before token prefixes)')
+        is_substring = ['csp' in header.lower() for header in self.search_index.search_headers('csp')]
+        self.assertIn(False, is_substring)
+        self.assertEqual(is_substring, sorted(is_substring, reverse=True))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'NotIn(prefixes of non-consecutive characters)')
+        self.assertNotIn('Truma_n_AmcuCommands::circFanSpeed', self.search_index.search_headers('fanspd'))
+
+    def test_incremental_search(self):
+        ''' Test that refining a query gives the same results as a fresh search. '''
+        TestHeaderSearch.var += 1
+        logging.info('TEST %s: %s', TestHeaderSearch.var, inspect.currentframe().f_code.co_name)
+
+        testcase, testcases = 1, 2
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(typed and fresh results)')
+        for typed in ['circfanspeed', 'amcu cfs', 'operation time']:
+            for length in range(1, len(typed) + 1):
+                fresh_index = header_search.HeaderSearchIndex(self.headers)
+                self.assertEqual(self.search_index.search(typed[:length]), fresh_index.search(typed[:length]))
+
+        testcase += 1
+        logging.debug('TESTCASE (%s/%s): %s', testcase, testcases, 'Equal(results after deleting characters)')
+        self.search_index.search('circfanspeedcon')
+        self.assertEqual(self.search_index.search('circfan'), header_search.HeaderSearchIndex(self.headers).search('circfan'))
+
+
+if __name__ == '__main__':
+    unittest.main()